@@ -48,37 +48,69 @@ from monitorcontrol import get_monitors, InputSource
 import platform      # OS detection for Windows-specific features
 import logging       # Application logging for debugging and error tracking
 import threading     # Background thread for non-blocking monitor detection
+import functools     # partial() for hotkey callbacks, lru_cache() for input lookups
 import os           # File system operations
 import sys          # System-specific parameters (for PyInstaller resource paths)
 import shutil       # High-level file operations (for migrating config files)
+from collections import deque  # Explicit stack for iterative widget tree walks
 from pathlib import Path  # Modern path handling
+from typing import NamedTuple  # Lightweight record type for favorites
+import re           # Precompiled model prefix matcher for brand detection
 import json         # JSON serialization for config files (shortcuts, favorites, settings)
+import argparse     # Command line parsing for CLI mode
+import time         # Monotonic timestamps for debouncing window manager events
+from concurrent.futures import ThreadPoolExecutor  # Parallel per-monitor DDC/CI probes
 from tkinter import messagebox  # Native dialog boxes for alerts and confirmations
 
 # Keyboard Hook Library - For registering global system-wide keyboard shortcuts
 import keyboard
 
-# Screen Information - For getting monitor dimensions and positions
-from screeninfo import get_monitors as get_screen_info
-
-# System Tray Support - For creating taskbar tray icon
+# Screen Information (screeninfo), System Tray Support (pystray) and Image
+# Processing (PIL) are imported lazily - see LAZY IMPORT HELPERS below.
+# Many sessions never touch the tray, so these stay out of the cold start.
 # FIX #4: Removed unused top-level 'import winreg' - it's imported locally in read_edid() where needed
-from pystray import Icon, Menu, MenuItem
-
-# Image Processing - For creating system tray icon image
-from PIL import Image, ImageDraw
 
 # Windows API Access - For setting dark title bar on Windows 10/11
 import ctypes
+from ctypes import wintypes  # Win32 type names for declaring API prototypes
 
 # ==============================================================================
 # GLOBAL CONFIGURATION CONSTANTS
 # ==============================================================================
 
+# Resolved once at import; checked on every monitor detection
+IS_WINDOWS = platform.system() == 'Windows'
+
 # Available themes for customtkinter appearance mode
 # "system" automatically follows Windows light/dark mode setting
 AVAILABLE_THEMES = ["dark", "light", "system"]
 
+# How long a monitor's cached name and input list stay valid (seconds)
+# Only the current input is re-read over DDC/CI while an entry is fresh
+MONITOR_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# App attributes that track the dialogs disabled during a monitor refresh
+TOPLEVEL_ATTRS = ('settings_window', 'theme_window', 'manage_window', 'editor_window')
+
+# Dialogs that are hidden (not destroyed) on close and reused on the next open
+REUSABLE_DIALOG_ATTRS = ('settings_window', 'theme_window', 'manage_window')
+
+# ==============================================================================
+# WIDGET STYLE PRESETS
+# ==============================================================================
+
+# Shared button color presets, splatted into CTkButton calls (**PRESET)
+# Tuples are (light mode, dark mode) colors
+DANGER_BUTTON_STYLE = {"fg_color": ("#D32F2F", "#C62828"), "hover_color": ("#C62828", "#B71C1C")}   # Red: Delete / Cancel
+EDIT_BUTTON_STYLE = {"fg_color": ("#1976D2", "#1565C0"), "hover_color": ("#1565C0", "#0D47A1")}     # Blue: Edit
+APPLY_BUTTON_STYLE = {"fg_color": ("#2B7A0B", "#5FB041"), "hover_color": ("#246A09", "#52A038")}    # Green: Switch / Apply
+SUCCESS_BUTTON_STYLE = {"fg_color": "#28a745", "hover_color": "#218838"}                            # Green: Save / Add
+CANCEL_BUTTON_STYLE = {"fg_color": "#dc3545", "hover_color": "#c82333"}                             # Red: dialog Cancel
+
+# Fixed (unscaled) fonts reused across the favorites and shortcuts dialogs
+FONT_SMALL = ("Arial", 11)
+FONT_BOLD = ("Arial", 12, "bold")
+
 # ==============================================================================
 # WINDOWS TITLE BAR CUSTOMIZATION
 # ==============================================================================
@@ -100,7 +132,7 @@ def set_dark_title_bar(window):
         - Only applies dark styling when CustomTkinter is in dark mode
     """
     # Skip if not running on Windows
-    if platform.system() != 'Windows':
+    if not IS_WINDOWS:
         return
     try:
         # Only apply dark title bar when the app is in dark mode
@@ -127,11 +159,74 @@ def set_dark_title_bar(window):
 # WINDOWS-SPECIFIC IMPORTS
 # ==============================================================================
 
-# Import WMI (Windows Management Instrumentation) only on Windows
-# WMI is used for querying detailed monitor information like PnP Device IDs
-if platform.system() == 'Windows':
-    import wmi        # Windows Management Instrumentation - for hardware queries
-    import pythoncom  # COM library initialization - required for WMI in threads
+# WMI (Windows Management Instrumentation) is used only on Windows for
+# querying detailed monitor information like PnP Device IDs. Both the wmi
+# package and pythoncom (pywin32) are loaded on demand by the helpers below,
+# from the monitor detection thread, so they stay out of the cold start.
+
+# ==============================================================================
+# LAZY IMPORT HELPERS
+# ==============================================================================
+
+# Module references populated on first use by the accessors below
+wmi = None
+pythoncom = None
+Icon = Menu = MenuItem = None
+Image = ImageDraw = None
+_screeninfo_get_monitors = None
+
+
+def _wmi_module():
+    """
+    Import and return the wmi module on first use (Windows only).
+    
+    Returns:
+        module: The wmi module
+    """
+    global wmi
+    if wmi is None:
+        import wmi  # Windows Management Instrumentation - for hardware queries
+    return wmi
+
+
+def _pythoncom_module():
+    """
+    Import and return the pythoncom module on first use (Windows only).
+    
+    Returns:
+        module: The pythoncom module (COM initialization for WMI in threads)
+    """
+    global pythoncom
+    if pythoncom is None:
+        import pythoncom
+    return pythoncom
+
+
+def _tray_modules():
+    """
+    Import the system tray (pystray) and image (PIL) classes on first use.
+    
+    Returns:
+        tuple: (Icon, Menu, MenuItem, Image, ImageDraw)
+    """
+    global Icon, Menu, MenuItem, Image, ImageDraw
+    if Icon is None:
+        from pystray import Icon, Menu, MenuItem
+        from PIL import Image, ImageDraw
+    return Icon, Menu, MenuItem, Image, ImageDraw
+
+
+def get_screen_info():
+    """
+    Return screeninfo's monitor list, importing screeninfo on first use.
+    
+    Returns:
+        list: screeninfo Monitor objects with x, y, width and height
+    """
+    global _screeninfo_get_monitors
+    if _screeninfo_get_monitors is None:
+        from screeninfo import get_monitors as _screeninfo_get_monitors
+    return _screeninfo_get_monitors()
 
 # ==============================================================================
 # CONFIGURATION DIRECTORY MANAGEMENT
@@ -158,7 +253,7 @@ def get_user_config_dir():
     app_name = 'monitor_manager'
     home = Path.home()
     try:
-        if platform.system() == 'Windows':
+        if IS_WINDOWS:
             # Use Windows AppData/Roaming for user-specific persistent data
             appdata = os.getenv('APPDATA')
             if not appdata:
@@ -210,6 +305,12 @@ PNP_IDS = {
     "GIG": "Gigabyte", "RAZ": "Razer",
 }
 
+# PnP Device ID prefixes of internal laptop panels (skipped during detection)
+# Kept as a tuple so a single str.startswith() call checks all of them
+INTERNAL_PANEL_PREFIXES = tuple(
+    "DISPLAY\\" + code for code in ("SHP", "BOE", "LGD", "AUO", "SEC", "EDP")
+)
+
 # ==============================================================================
 # DDC/CI INPUT SOURCE CODES
 # ==============================================================================
@@ -225,12 +326,67 @@ PNP_IDS = {
 VCP_INPUT_THUNDERBOLT = 26  # Code 0x1A - Thunderbolt (uses USB-C connector with DP protocol)
 VCP_INPUT_USB_C = 27        # Code 0x1B - USB-C with DisplayPort Alt Mode
 
+# Standard InputSource enum mapping based on DDC/CI specification
+# VCP_INPUT_THUNDERBOLT (26) and VCP_INPUT_USB_C (27) are custom additions
+# Built once at import time; source of the code <-> name tables below
+STANDARD_INPUT_NAMES = {
+    0: "NO INPUT",
+    1: "VGA1",         # Changed from ANALOG1/VGA for clarity
+    2: "VGA2",         # Changed from ANALOG2 for clarity
+    3: "DVI1",
+    4: "DVI2",
+    5: "COMPOSITE1",
+    6: "COMPOSITE2",
+    7: "SVIDEO1",
+    8: "SVIDEO2",
+    9: "TUNER1",
+    10: "TUNER2",
+    11: "TUNER3",
+    12: "COMPONENT1",
+    13: "COMPONENT2",
+    14: "COMPONENT3",
+    15: "DP1",         # DisplayPort 1
+    16: "DP2",         # DisplayPort 2
+    17: "HDMI1",
+    18: "HDMI2",
+    VCP_INPUT_THUNDERBOLT: "THUNDERBOLT",  # Code 26
+    VCP_INPUT_USB_C: "USB-C"               # Code 27
+}
+
+# Codes are small dense integers, so get_input_name() indexes a tuple
+# (None for unassigned codes) instead of hashing into the dict
+INPUT_NAMES_BY_CODE = tuple(STANDARD_INPUT_NAMES.get(code) for code in range(max(STANDARD_INPUT_NAMES) + 1))
+
+# Name -> code for the custom inputs that have no InputSource member,
+# see _resolve_input_value(). Limited to these two on purpose: display-only
+# names such as "VGA1" or "NO INPUT" are not accepted as switch targets.
+INPUT_CODES_BY_NAME = {
+    STANDARD_INPUT_NAMES[VCP_INPUT_THUNDERBOLT]: VCP_INPUT_THUNDERBOLT,
+    STANDARD_INPUT_NAMES[VCP_INPUT_USB_C]: VCP_INPUT_USB_C,
+}
+
+# InputSource names accepted by the CLI --input option, computed once at import
+VALID_INPUT_NAMES = frozenset(x for x in dir(InputSource) if not x.startswith('_'))
+VALID_INPUT_NAMES_TEXT = ", ".join(sorted(VALID_INPUT_NAMES))  # For error messages
+
+# Input choices offered in dialogs when a monitor reported no inputs
+# (a tuple, so the shared default can never be mutated through a dialog)
+FALLBACK_INPUT_NAMES = ("DP1", "HDMI1", "DP2", "HDMI2")
+
+# Map of shifted characters to their base number keys, used when recording shortcuts
+# e.g., Shift+2 produces '@', but we want to record as 'shift+2'
+SHIFTED_CHAR_TO_KEY = {
+    '@': '2', '!': '1', '#': '3', '$': '4', '%': '5',
+    '^': '6', '&': '7', '*': '8', '(': '9', ')': '0'
+}
+
 # Model prefix to brand name mapping
 # Used as a fallback when PnP ID lookup fails
 # Maps common monitor model prefixes to their manufacturer
 MODEL_BRAND_MAP = {
     # ASUS monitor model prefixes
-    "PA": "ASUS", "PG": "ASUS", "VG": "ASUS", "MG": "ASUS", "ROG": "ASUS", 
+    # ("VG" is shared with ViewSonic and mapped there, see below)
+    "PA": "ASUS", "PG": "ASUS", "MG": "ASUS", "ROG": "ASUS", 
     "TUF": "ASUS", "BE": "ASUS",
     # Dell/Alienware
     "AW": "Alienware", 
@@ -262,6 +418,12 @@ MODEL_BRAND_MAP = {
     "BDM": "Philips", "PHL": "Philips", "PHI": "Philips"
 }
 
+# Single anchored alternation of all model prefixes, longest first, so one
+# regex match finds the most specific prefix (e.g. "MPG" before "MP")
+MODEL_BRAND_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in sorted(MODEL_BRAND_MAP, key=len, reverse=True))
+)
+
 # FIX #2: Removed static 'monitors = get_monitors()' that only ran at module load.
 # Monitors are now refreshed dynamically in get_all_monitor_data() to detect
 # newly connected/disconnected monitors during runtime.
@@ -441,6 +603,10 @@ class UIScaler:
 # PYINSTALLER RESOURCE PATH HELPER
 # ==============================================================================
 
+# PyInstaller extracts resources to a temp folder stored in sys._MEIPASS;
+# in development mode resources are read from the current directory
+RESOURCE_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
 def resource_path(relative_path):
     """
     Get the absolute path to a resource file, works for dev and PyInstaller.
@@ -458,13 +624,23 @@ def resource_path(relative_path):
     Example:
         icon_path = resource_path('monitor_manager_icon.ico')
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # Running in development mode - use current directory
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(RESOURCE_BASE_PATH, relative_path)
+
+
+# ==============================================================================
+# FAVORITE RECORD TYPE
+# ==============================================================================
+
+class Favorite(NamedTuple):
+    """
+    A saved favorite setup: which monitor to switch and to which input.
+    
+    Being a tuple subclass, it still unpacks as (monitor_id, input_source)
+    and is written to favorites.json as a plain [monitor_id, input_source]
+    list, so existing config files stay compatible.
+    """
+    monitor_id: int
+    input_source: str
 
 
 # ==============================================================================
@@ -530,9 +706,10 @@ class App(customtkinter.CTk):
         self.geometry(self.ui.window_size(520, 540))
         self.resizable(True, True)  # Allow window resizing for accessibility
         
-        # Position window on an active display (one showing PC content)
-        # This handles the case where primary display is connected but showing another input
-        self._position_on_active_display()
+        # Stay hidden until the first detection pass has picked a display
+        # showing PC content (see _place_on_active_display)
+        self.withdraw()
+        self._awaiting_placement = True
         
         # Set window icon (if available)
         try:
@@ -544,7 +721,10 @@ class App(customtkinter.CTk):
         # SYSTEM TRAY SETUP
         # ----------------------------------------------------------------------
         self.tray_icon = None        # pystray Icon object (created when minimizing to tray)
+        self._tray_icon_img = None   # Cached PIL image for the tray icon
+        self._tray_image_thread = None  # Daemon thread drawing the tray icon image ahead of time
         self.is_quitting = False     # Flag to distinguish close vs minimize to tray
+        self._last_unmap_ts = 0.0    # Debounce guard for <Unmap> bursts from the window manager
         
         # Easter egg click counter (hidden feature)
         self._easter_egg_clicks = 0
@@ -553,6 +733,12 @@ class App(customtkinter.CTk):
         # FIX #2: Instance-level monitors list (refreshed dynamically)
         # Previously was a module-level variable that only updated at startup
         self.monitors = []
+        self._monitor_count = 0  # len(self.monitors), refreshed with the list
+        self.monitors_by_name = {}  # Display name -> monitor data, set after detection
+        # Values last given to the monitor/input dropdowns; CTkOptionMenu
+        # rebuilds its menu on every configure(values=...), so skip repeats
+        self._last_monitor_values = None
+        self._last_input_values = None
         
         # Override window close behavior and minimize behavior
         # Default behavior is set in update_tray_behavior() based on settings
@@ -565,16 +751,14 @@ class App(customtkinter.CTk):
         # ----------------------------------------------------------------------
         # CONFIGURATION FILE PATHS
         # ----------------------------------------------------------------------
-        config_dir = get_user_config_dir()
-        try:
-            os.makedirs(config_dir, exist_ok=True)
-        except Exception:
-            pass
+        # The module-level config_dir was already created at import time
+        # (see LOGGING CONFIGURATION), so no second makedirs is needed here
 
         # JSON files for persistent storage
         self.shortcuts_file = os.path.join(config_dir, 'custom_shortcuts.json')  # Keyboard shortcuts
         self.favorites_file = os.path.join(config_dir, 'favorites.json')          # Saved favorites
         self.settings_file = os.path.join(config_dir, 'settings.json')            # App settings
+        self.monitor_cache_file = os.path.join(config_dir, 'monitor_cache.json')  # Cached monitor names/inputs
 
         # Migrate old shortcuts file from application directory to user config directory
         # This ensures settings persist across application updates
@@ -590,7 +774,13 @@ class App(customtkinter.CTk):
         # LOAD SAVED DATA
         # ----------------------------------------------------------------------
         self.shortcuts = self.load_shortcuts() or {}   # Dict: shortcut_key -> (monitor_id, input_source)
-        self.favorites = self.load_favorites() or {}   # Dict: name -> (monitor_id, input_source)
+        self.favorites = self.load_favorites() or {}   # Dict: name -> Favorite(monitor_id, input_source)
+        # Lowercased name -> actual name, kept in sync with self.favorites for
+        # O(1) case-insensitive duplicate checks
+        self._favorites_lower = {k.lower(): k for k in self.favorites}
+        
+        # Monitor names/inputs from previous detections (see collect_monitor_data)
+        self._monitor_cache = self.load_monitor_cache() or {}
         
         # Default window behavior is normal Windows behavior (no system tray)
         # tray_on values: "none", "close", "minimize", "both"
@@ -673,6 +863,17 @@ class App(customtkinter.CTk):
         self.manage_window = None      # Manage favorites dialog window
         self.editor_window = None      # Shortcuts editor dialog window
         self._loading_monitors = False # Flag indicating monitor detection in progress
+        self._toplevel_widget_cache = {}  # attr -> (window, widgets) between disable/enable
+        self._stale_dialogs = set()    # Reusable dialogs to destroy (not hide) on close after a DPI change
+        self._mf_input_update_job = None  # Pending after() id for the favorites form input refresh
+        
+        # "ID: Display Name" dropdown strings, rebuilt once per monitor detection
+        # and shared by every dialog (see _index_monitors_data)
+        self._mon_choice_strings = []
+        self._mon_choice_by_id = {}
+        self._mon_id_by_choice = {}  # Reverse of _mon_choice_by_id for parsing selections
+        self._inputs_by_id = {}  # monitor id -> available input names
+        self._monitors_by_id = {}  # monitor id -> monitors_data entry
 
         # ==================================================================
         # MAIN UI LAYOUT - MONITOR SELECTION CARD
@@ -749,8 +950,7 @@ class App(customtkinter.CTk):
             command=self.switch_input,
             height=self.ui.size(42),
             font=self.ui.font("Arial", 14, "bold"),
-            fg_color=("#2B7A0B", "#5FB041"),      # Green colors (light/dark mode)
-            hover_color=("#246A09", "#52A038")
+            **APPLY_BUTTON_STYLE  # Green colors (light/dark mode)
         )
         self.switch_button.pack(fill="x", pady=(0, self.ui.size(10)))
 
@@ -799,6 +999,11 @@ class App(customtkinter.CTk):
         self.favorites_scroll.pack(fill="x", expand=False, padx=self.ui.size(12), pady=(0, self.ui.size(12)))
         self.favorites_scroll.pack_propagate(False)
 
+        # Favorite buttons are pooled and reused across refreshes instead of
+        # being destroyed and recreated (see refresh_favorites_buttons)
+        self._fav_button_pool = []
+        self._fav_placeholder = None
+
         # ==================================================================
         # MAIN UI LAYOUT - STATUS BAR
         # ==================================================================
@@ -834,9 +1039,11 @@ class App(customtkinter.CTk):
         # ==================================================================
         
         # Trigger monitor detection after a brief delay to allow UI to render
-        self.after(100, self.refresh_monitors)
+        # (the first pass also places and shows the window, see above)
+        # (force=False: the first pass may reuse the on-disk monitor cache)
+        self.after(100, self.refresh_monitors, False)
 
-    def refresh_monitors(self):
+    def refresh_monitors(self, force=True):
         """
         Initiate asynchronous monitor detection and refresh the UI.
         
@@ -849,6 +1056,10 @@ class App(customtkinter.CTk):
         The actual detection happens in load_monitor_data_thread() and
         UI is updated in update_ui_after_load() when detection completes.
         
+        Args:
+            force: Re-read every monitor's capabilities instead of using
+                   the monitor cache (default for the Refresh button)
+        
         Thread Safety:
             Uses threading.Thread with daemon=True so the thread is
             automatically terminated when the main application exits.
@@ -863,9 +1074,10 @@ class App(customtkinter.CTk):
         self.refresh_button.configure(state="disabled")
         
         # Gray-out monitor/input dropdowns and set placeholder text
-        self.monitor_menu.configure(values=["Loading..."], state="disabled")
+        # (values are left alone so an unchanged list isn't rebuilt later)
+        self.monitor_menu.configure(state="disabled")
         self.monitor_menu.set("Loading...")
-        self.input_menu.configure(values=["Loading..."], state="disabled")
+        self.input_menu.configure(state="disabled")
         self.input_menu.set("Loading...")
         
         # Disable header buttons until monitors are detected
@@ -896,10 +1108,10 @@ class App(customtkinter.CTk):
 
         # Start background thread for monitor detection
         # daemon=True ensures thread terminates with main app
-        thread = threading.Thread(target=self.load_monitor_data_thread, daemon=True)
+        thread = threading.Thread(target=self.load_monitor_data_thread, args=(force,), daemon=True)
         thread.start()
 
-    def load_monitor_data_thread(self):
+    def load_monitor_data_thread(self, force=False):
         """
         Background thread function for monitor detection.
         
@@ -909,24 +1121,39 @@ class App(customtkinter.CTk):
         On Windows, COM must be initialized for each thread that uses WMI,
         hence the pythoncom.CoInitialize/CoUninitialize calls.
         
+        On the first run it also finds the displays showing PC content
+        before detection and schedules _place_on_active_display(), which
+        shows the still-withdrawn main window.
+        
         After detection completes, schedules update_ui_after_load() to
-        run on the main thread using self.after(0, ...).
+        run on the main thread using self.after(0, ...). The new monitor
+        cache is handed over as an argument; this thread only reads
+        self._monitor_cache and never modifies it.
+        
+        Args:
+            force: Bypass the monitor cache (see refresh_monitors)
         """
+        if self._awaiting_placement:
+            self._awaiting_placement = False
+            screens, active_indices = self._find_active_displays()
+            self.after(0, self._place_on_active_display, screens, active_indices)
+        
         # Initialize COM for WMI access on Windows (required per-thread)
-        if platform.system() == 'Windows':
-            pythoncom.CoInitialize()
+        # (first use also imports pywin32, off the UI thread)
+        if IS_WINDOWS:
+            _pythoncom_module().CoInitialize()
         try:
             # Perform the actual monitor detection
-            self.monitors_data = self.get_all_monitor_data()
+            self.monitors_data, monitor_cache = self.get_all_monitor_data(force)
         finally:
             # Clean up COM on Windows
-            if platform.system() == 'Windows':
+            if IS_WINDOWS:
                 pythoncom.CoUninitialize()
         
         # Schedule UI update on main thread (thread-safe)
-        self.after(0, self.update_ui_after_load)
+        self.after(0, self.update_ui_after_load, monitor_cache)
 
-    def update_ui_after_load(self):
+    def update_ui_after_load(self, monitor_cache=None):
         """
         Update the UI after monitor detection completes.
         
@@ -940,12 +1167,30 @@ class App(customtkinter.CTk):
         
         If no monitors are detected, appropriate error messages are shown
         and shortcuts/favorites remain disabled.
+        
+        Args:
+            monitor_cache: New monitor cache built by the detection thread
         """
+        # Rebuild cached lookups derived from the fresh monitor data
+        self._index_monitors_data()
+        
+        # Adopt and persist the new monitor cache so the next detection can
+        # skip the slow capabilities reads (replaced and written here, on
+        # the main thread)
+        if monitor_cache is not None:
+            self._monitor_cache = monitor_cache
+            self.save_monitor_cache()
+        
         # Extract display names from monitor data for dropdown
         self.monitor_names = [data['display_name'] for data in self.monitors_data]
+        # Display name -> monitor data for O(1) lookups in update_inputs;
+        # reversed so the first monitor wins if two share a name
+        self.monitors_by_name = {data['display_name']: data for data in reversed(self.monitors_data)}
         
         # Update monitor dropdown with detected monitors
-        self.monitor_menu.configure(values=self.monitor_names)
+        if self.monitor_names != self._last_monitor_values:
+            self.monitor_menu.configure(values=self.monitor_names)
+            self._last_monitor_values = self.monitor_names
         
         if self.monitor_names:
             # Monitors found - set up UI for normal operation
@@ -986,7 +1231,9 @@ class App(customtkinter.CTk):
                 self.monitor_menu.configure(state="disabled")
             except Exception:
                 pass
-            self.input_menu.configure(values=[])
+            if self._last_input_values != []:
+                self.input_menu.configure(values=[])
+                self._last_input_values = []
             self.input_menu.set("")
             try:
                 self.input_menu.configure(state="disabled")
@@ -1021,235 +1268,44 @@ class App(customtkinter.CTk):
         except Exception:
             pass
     
-    def get_all_monitor_data(self):
+    def _index_monitors_data(self):
+        """
+        Rebuild lookups derived from self.monitors_data.
+        
+        Called once after each monitor detection so dialogs can reuse the
+        precomputed "ID: Display Name" strings instead of rebuilding them
+        every time they open, and look up a monitor (or its inputs) by id
+        without scanning the monitor list.
+        """
+        monitors_list = getattr(self, 'monitors_data', None) or []
+        self._mon_choice_strings = [f"{m['id']}: {m['display_name']}" for m in monitors_list]
+        self._mon_choice_by_id = {
+            m['id']: choice for m, choice in zip(monitors_list, self._mon_choice_strings)
+        }
+        self._mon_id_by_choice = {choice: mon_id for mon_id, choice in self._mon_choice_by_id.items()}
+        self._inputs_by_id = {m.get('id'): m.get('inputs', []) or [] for m in monitors_list}
+        self._monitors_by_id = {m.get('id'): m for m in monitors_list}
+
+    def get_all_monitor_data(self, force=False):
         """
         Detect all connected monitors and gather their information.
         
-        This method performs DDC/CI communication to detect monitors and
-        retrieve their capabilities including:
-        - Brand name (from PnP ID or model prefix)
-        - Model name (from VCP capabilities or EDID)
-        - Available input sources
-        - Current input source
+        Refreshes self.monitors and the cached monitor count, then delegates
+        the DDC/CI and WMI probing to collect_monitor_data(). Monitor names
+        and inputs found in self._monitor_cache are reused instead of
+        being re-read over DDC/CI unless force is set.
         
-        Returns:
-            list: List of dictionaries containing monitor data:
-                - 'display_name': Human-readable name (e.g., "Samsung - C27G2")
-                - 'inputs': List of available input names (e.g., ["HDMI1", "DP1"])
-                - 'id': Monitor index for addressing
-                - 'current_input': Currently selected input name
+        Args:
+            force: Ignore the monitor cache and re-read capabilities
         
-        Technical Details:
-            - Uses monitorcontrol library for DDC/CI communication
-            - Uses WMI on Windows to get PnP Device IDs for brand detection
-            - Reads EDID data from registry for model detection fallback
-            - Skips internal laptop displays (identified by specific PnP codes)
+        Returns:
+            tuple: (monitors_data, new_cache) (see collect_monitor_data)
         """
-        all_data = []
-        pnp_ids = []
-
         # FIX #2: Refresh monitors list each time this method is called
         # This ensures newly connected/disconnected monitors are detected
         self.monitors = get_monitors()
-
-        try:
-            logging.info(f"Found {len(self.monitors)} monitors.")
-            
-            # Log display adapter information for debugging
-            if platform.system() == "Windows":
-                try:
-                    c = wmi.WMI()
-                    video_controllers = c.Win32_VideoController()
-                    for controller in video_controllers:
-                        logging.info(f"Display adapter: {controller.Name}, Status: {controller.Status}")
-                except Exception as e:
-                    logging.warning(f"Could not get display adapter info: {e}")
-                    
-        except Exception as e:
-            logging.error(f"Could not get monitors: {e}")
-            return []
-
-        # ------------------------------------------------------------------
-        # COLLECT PNP DEVICE IDS FROM WMI (Windows only)
-        # ------------------------------------------------------------------
-        # FIX #1: Collect PnP IDs from WMI once (moved outside the monitor loop)
-        # Previously this was nested inside 'for monitor in monitors:' and used
-        # 'for monitor in wmi_monitors:' which shadowed the outer variable,
-        # causing only 1 monitor to be processed.
-        if platform.system() == "Windows":
-            try:
-                c = wmi.WMI()
-                wmi_monitors = c.Win32_DesktopMonitor()
-                for wmi_mon in wmi_monitors:
-                    pnp_ids.append(getattr(wmi_mon, 'PNPDeviceID', None))
-            except Exception as e:
-                logging.error(f"Failed to get device information from WMI: {e}")
-        logging.info(f"WMI PnP IDs: {pnp_ids}")
-
-        # ------------------------------------------------------------------
-        # HELPER FUNCTIONS FOR EDID PARSING
-        # ------------------------------------------------------------------
-        
-        def read_edid(pnp_id):
-            """
-            Read EDID (Extended Display Identification Data) from Windows registry.
-            
-            EDID is a standardized data structure that contains information about
-            the monitor including manufacturer, model, and supported resolutions.
-            
-            Args:
-                pnp_id: The PnP Device ID string from WMI
-                
-            Returns:
-                bytes: Raw EDID data or None if not found
-            """
-            try:
-                import winreg
-                # EDID is stored in the monitor's Device Parameters registry key
-                key = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE,
-                    r"SYSTEM\\CurrentControlSet\\Enum\\" + pnp_id + r"\Device Parameters"
-                )
-                edid_data, _ = winreg.QueryValueEx(key, "EDID")
-                return edid_data
-            except Exception:
-                return None
-
-        def parse_edid(edid):
-            """
-            Extract model name from EDID data.
-            
-            The model name is stored as ASCII text in bytes 54-72 of the EDID
-            (specifically in the descriptor blocks which start at byte 54).
-            
-            Args:
-                edid: Raw EDID bytes
-                
-            Returns:
-                str: Model name or "Unknown" if parsing fails
-            """
-            try:
-                # Extract printable ASCII characters from descriptor block
-                model = "".join(chr(c) for c in edid[54:72] if 32 <= c <= 126).strip()
-                return model if model else "Unknown"
-            except Exception:
-                return "Unknown"
-
-        # ------------------------------------------------------------------
-        # PROCESS EACH DETECTED MONITOR
-        # ------------------------------------------------------------------
-        
-        for i, monitor_obj in enumerate(self.monitors):
-            # Skip internal laptop displays on Windows
-            # These are identified by specific PnP codes like SHP, BOE, LGD, etc.
-            if platform.system() == "Windows" and i < len(pnp_ids) and pnp_ids[i]:
-                pnp_id_str = pnp_ids[i].upper()
-                # Common internal display manufacturer codes
-                if any(x in pnp_id_str for x in ["SHP", "BOE", "LGD", "AUO", "SEC", "EDP"]):
-                    logging.info(f"Skipping internal laptop display at index {i} ({pnp_id_str})")
-                    continue
-
-            model = "Unknown"
-            brand = "Unknown"
-
-            # ------------------------------------------------------------------
-            # GET MODEL NAME FROM VCP CAPABILITIES
-            # ------------------------------------------------------------------
-            try:
-                with monitor_obj:
-                    caps = monitor_obj.get_vcp_capabilities()
-                    model = caps.get('model', "Unknown")
-            except:
-                pass
-
-            # Fallback: Try to get model from EDID if VCP didn't provide it
-            if model == "Unknown" and platform.system() == "Windows" and i < len(pnp_ids) and pnp_ids[i]:
-                edid = read_edid(pnp_ids[i])
-                if edid:
-                    model = parse_edid(edid)
-
-            # ------------------------------------------------------------------
-            # DETERMINE BRAND NAME
-            # ------------------------------------------------------------------
-            if platform.system() == "Windows":
-                # First try: Get brand from PNP manufacturer code (first 3 chars)
-                if brand == "Unknown" and i < len(pnp_ids):
-                    try:
-                        if pnp_ids[i]:
-                            # PnP ID format: MANUFACTURER\MODEL\SERIAL
-                            # Extract the 3-letter manufacturer code
-                            pnp_code = pnp_ids[i].split('\\')[1][:3].upper()
-                            brand = PNP_IDS.get(pnp_code, "Unknown")
-                    except Exception:
-                        pass
-               
-                # Fallback: Match model prefix to known brand patterns
-                if brand == "Unknown" and model != "Unknown":
-                    model_upper = model.upper()
-                    for prefix, brand_name in MODEL_BRAND_MAP.items():
-                        if model_upper.startswith(prefix):
-                            brand = brand_name
-                            break
-
-            # ------------------------------------------------------------------
-            # GET AVAILABLE INPUT SOURCES
-            # ------------------------------------------------------------------
-            try:
-                input_names = []
-                with monitor_obj:
-                    caps = monitor_obj.get_vcp_capabilities()
-                    inputs = caps.get('inputs', [])
-                    
-                    for inp in inputs:
-                        if hasattr(inp, 'name'):
-                            # Standard InputSource enum member
-                            input_names.append(inp.name)
-                        elif isinstance(inp, int):
-                            # Raw integer code - map to known types or display as-is
-                            # USB-C with DisplayPort Alt Mode uses code 27 (0x1B)
-                            # Thunderbolt also uses USB-C connector with DP protocol
-                            if inp == VCP_INPUT_USB_C:
-                                input_names.append("USB-C")
-                            elif inp == VCP_INPUT_THUNDERBOLT:
-                                input_names.append("THUNDERBOLT")
-                            else:
-                                # Unknown input code - display as is for debugging
-                                input_names.append(f"INPUT_{inp}")
-
-            except Exception as e:
-                logging.warning(f"Could not get inputs for monitor {i}: {e}")
-
-            # ------------------------------------------------------------------
-            # GET CURRENT INPUT SOURCE
-            # ------------------------------------------------------------------
-            try:
-                with monitor_obj:
-                    current_input = monitor_obj.get_input_source()
-                    if hasattr(current_input, 'value'):
-                        # Standard InputSource enum member
-                        current_code = current_input.value
-                        current_name = current_input.name if hasattr(current_input, 'name') else str(current_input)
-                    else:
-                        # Raw integer code
-                        current_code = int(current_input)
-                        current_name = get_input_name(current_code)
-            except Exception as e:
-                    logging.warning(f"⚠️  Could not read current input: {e}")
-                    current_code = None
-                    current_name = "Unknown"
-
-            # ------------------------------------------------------------------
-            # ADD MONITOR DATA TO RESULTS
-            # ------------------------------------------------------------------
-            all_data.append({
-                "display_name": f"{brand} - {model}",  # e.g., "Samsung - C27G2"
-                "inputs": input_names,                  # e.g., ["HDMI1", "DP1", "USB-C"]
-                "id": i,                               # Monitor index for addressing
-                "current_input": current_name          # e.g., "HDMI1"
-            })
-
-        logging.info(f"All monitor data: {all_data}")
-        return all_data
+        self._monitor_count = len(self.monitors)  # Cached bound for switch paths
+        return collect_monitor_data(self.monitors, self._monitor_cache, force)
 
     def update_inputs(self, selected_monitor_name):
         """
@@ -1265,13 +1321,16 @@ class App(customtkinter.CTk):
                                    (e.g., "Samsung - C27G2")
         """
         # Find the monitor data matching the selected name
-        for data in self.monitors_data:
-            if data['display_name'] == selected_monitor_name:
-                self.selected_monitor_data = data
-                break
+        data = self.monitors_by_name.get(selected_monitor_name)
+        if data is None:
+            return  # Unknown name - keep the dropdown as it is
+        self.selected_monitor_data = data
         
         # Update input dropdown with available inputs for selected monitor
-        self.input_menu.configure(values=self.selected_monitor_data['inputs'])
+        inputs = self.selected_monitor_data['inputs']
+        if inputs != self._last_input_values:
+            self.input_menu.configure(values=inputs)
+            self._last_input_values = inputs
         
         if self.selected_monitor_data['inputs']:
             # Try to pre-select the current input if it's in the available list
@@ -1284,71 +1343,88 @@ class App(customtkinter.CTk):
         else:
             self.input_menu.set("No inputs found")
 
-    def _position_on_active_display(self):
+    def _find_active_displays(self):
         """
-        Position the window on a display that is actively showing PC content.
+        Find the displays that are actively showing PC content.
         
         When a monitor is switched to a different input (e.g., showing a game
         console instead of PC), DDC/CI commands may fail on that monitor.
-        This method finds monitors that respond to DDC/CI queries and
-        positions the app window on one of them.
+        This method finds monitors that respond to DDC/CI queries.
         
-        Use Case:
-            User has dual monitors. Monitor 1 is showing the PC, Monitor 2 is
-            showing a PlayStation. This method ensures the app window appears
-            on Monitor 1 (the active PC display).
+        Runs on the detection thread (see load_monitor_data_thread), ahead
+        of detection, so the DDC/CI reads neither block the UI nor overlap
+        with the detection probes.
+        
+        Returns:
+            tuple: (screens, active_indices) - the screeninfo monitor list
+                   and the indices of monitors that answered; both empty
+                   when there is nothing to choose between
         """
         try:
             all_screens = get_screen_info()
             if not all_screens or len(all_screens) <= 1:
-                return  # Only one screen or none, use default positioning
-            
-            # Get DDC/CI monitors to check which are showing PC content
-            ddc_monitors = get_monitors()
-            if not ddc_monitors:
-                return
+                return [], []  # Only one screen or none, use default positioning
             
             # Find monitors that respond to DDC/CI (indicating they're showing PC input)
             # Monitors showing other inputs (console, etc.) won't respond to get_input_source()
             active_indices = []
-            for i, mon in enumerate(ddc_monitors):
+            for i, mon in enumerate(get_monitors()):
                 try:
                     with mon:
                         mon.get_input_source()  # Will fail if not showing PC
                         active_indices.append(i)
                 except Exception:
                     pass  # Monitor not showing PC input
-            
-            if not active_indices:
-                return
-            
-            # Get current window position to find which screen it's on
-            self.update_idletasks()
-            app_x, app_y = self.winfo_x(), self.winfo_y()
-            
-            # Find current screen based on window position
-            current_screen = None
-            current_screen_idx = 0
-            for idx, screen in enumerate(all_screens):
-                if (screen.x <= app_x < screen.x + screen.width and
-                    screen.y <= app_y < screen.y + screen.height):
-                    current_screen = screen
-                    current_screen_idx = idx
-                    break
-            
-            # If current screen is not showing PC content, move to an active screen
-            if current_screen_idx not in active_indices:
-                # Find an active screen to move to
-                for idx in active_indices:
-                    if idx < len(all_screens):
-                        new_screen = all_screens[idx]
-                        # Position window 50 pixels from top-left corner
-                        self.geometry(f"+{new_screen.x + 50}+{new_screen.y + 50}")
-                        self.update_idletasks()
-                        logging.info(f"Positioned app on active display {idx}")
+            return all_screens, active_indices
+        except Exception as e:
+            logging.debug(f"Could not find active displays: {e}")
+            return [], []
+
+    def _place_on_active_display(self, all_screens, active_indices):
+        """
+        Position the window on an active display, then show it.
+        
+        Called once on the main thread with the result of
+        _find_active_displays(). The window is always shown, even if
+        placement fails.
+        
+        Use Case:
+            User has dual monitors. Monitor 1 is showing the PC, Monitor 2 is
+            showing a PlayStation. This method ensures the app window appears
+            on Monitor 1 (the active PC display).
+        
+        Args:
+            all_screens: screeninfo monitor list
+            active_indices: Indices of monitors showing PC content
+        """
+        try:
+            if active_indices:
+                # Get current window position to find which screen it's on
+                self.update_idletasks()
+                app_x, app_y = self.winfo_x(), self.winfo_y()
+                
+                # Find current screen based on window position
+                current_screen_idx = 0
+                for idx, screen in enumerate(all_screens):
+                    if (screen.x <= app_x < screen.x + screen.width and
+                        screen.y <= app_y < screen.y + screen.height):
+                        current_screen_idx = idx
                         break
+                
+                # If current screen is not showing PC content, move to an active screen
+                if current_screen_idx not in active_indices:
+                    # Find an active screen to move to
+                    for idx in active_indices:
+                        if idx < len(all_screens):
+                            new_screen = all_screens[idx]
+                            # Position window 50 pixels from top-left corner
+                            self.geometry(f"+{new_screen.x + 50}+{new_screen.y + 50}")
+                            logging.info(f"Positioned app on active display {idx}")
+                            break
         except Exception as e:
             logging.debug(f"Could not position on active display: {e}")
+        finally:
+            self.deiconify()
     
     def move_app_if_on_switching_monitor(self, monitor_id):
         """
@@ -1387,9 +1463,9 @@ class App(customtkinter.CTk):
             
             # If the app is on the screen we're about to switch, move it to another screen
             if app_current_screen and app_current_screen == screen_to_switch:
-                other_screens = [s for s in all_screens if s != screen_to_switch]
-                if other_screens:
-                    new_screen = other_screens[0]
+                # Stop at the first other screen instead of listing them all
+                new_screen = next((s for s in all_screens if s != screen_to_switch), None)
+                if new_screen:
                     self.geometry(f"+{new_screen.x}+{new_screen.y}")
                     self.update_idletasks()  # Ensure the move is processed before switching
         except Exception as e:
@@ -1425,16 +1501,10 @@ class App(customtkinter.CTk):
             self.move_app_if_on_switching_monitor(selected_monitor_id)
 
             # Convert input name string to the appropriate DDC/CI code
-            if new_input_str == "USB-C":
-                new_input = VCP_INPUT_USB_C  # Code 27
-            elif new_input_str == "THUNDERBOLT":
-                new_input = VCP_INPUT_THUNDERBOLT  # Code 26
-            elif new_input_str.startswith("INPUT_"):
-                # Handle unknown input codes (INPUT_XX format)
-                new_input = int(new_input_str.split('_')[1])
-            else:
-                # Standard InputSource enum values (HDMI1, DP1, etc.)
-                new_input = getattr(InputSource, new_input_str)
+            # (InputSource member, custom code like USB-C, or INPUT_XX)
+            new_input = _resolve_input_value(new_input_str)
+            if new_input is None:
+                raise ValueError(f"Unknown input source: {new_input_str}")
             logging.info(f"Input name: {new_input}")
 
             # Send the DDC/CI command to switch input
@@ -1469,14 +1539,13 @@ class App(customtkinter.CTk):
             Uses the 'keyboard' library which requires appropriate permissions
             on some systems (e.g., accessibility permissions on macOS).
         """
+        # Handles of registered user shortcuts, updated one at a time afterwards
+        # by _register_hotkey() / _unregister_hotkey()
+        self._hotkey_handles = {}
         try:
             # Register each user-defined shortcut
             for shortcut, (monitor_id, input_source) in self.shortcuts.items():
-                keyboard.add_hotkey(
-                    shortcut,
-                    # Lambda captures m and i by value to avoid closure issues
-                    lambda m=monitor_id, i=input_source: self.handle_global_hotkey(m, i)
-                )
+                self._register_hotkey(shortcut, monitor_id, input_source)
             
             # Always register the help hotkey (Ctrl+Shift+H)
             keyboard.add_hotkey('ctrl+shift+h', self.show_shortcuts_help)
@@ -1484,6 +1553,41 @@ class App(customtkinter.CTk):
         except Exception as e:
             logging.error(f"Failed to register global hotkeys: {e}")
 
+    def _register_hotkey(self, shortcut, monitor_id, input_source):
+        """
+        Register a single user shortcut, replacing any existing binding for it.
+        
+        The handle returned by keyboard.add_hotkey() is kept in
+        self._hotkey_handles so one shortcut can be updated without
+        clearing and re-registering every other hotkey.
+        
+        Args:
+            shortcut: Keyboard shortcut string (e.g., "ctrl+alt+1")
+            monitor_id: Index of the monitor to switch
+            input_source: Name of the input source (e.g., "HDMI1")
+        """
+        self._unregister_hotkey(shortcut)
+        self._hotkey_handles[shortcut] = keyboard.add_hotkey(
+            shortcut,
+            # partial binds the arguments up front (no closure cells) and
+            # dispatches without an extra Python frame on each key press
+            functools.partial(self.handle_global_hotkey, monitor_id, input_source)
+        )
+
+    def _unregister_hotkey(self, shortcut):
+        """
+        Remove a single user shortcut registered by _register_hotkey().
+        
+        Args:
+            shortcut: Keyboard shortcut string (e.g., "ctrl+alt+1")
+        """
+        old_handle = self._hotkey_handles.pop(shortcut, None)
+        if old_handle is not None:
+            try:
+                keyboard.remove_hotkey(old_handle)
+            except Exception:
+                pass
+
     def handle_global_hotkey(self, monitor_id, input_source):
         """
         Handle a global hotkey press by switching the specified monitor to the specified input.
@@ -1498,28 +1602,18 @@ class App(customtkinter.CTk):
         """
         try:
             # Validate monitor exists
-            if monitor_id < len(self.monitors):
+            if monitor_id < self._monitor_count:
                 # Get monitor display name for status message
-                monitor_name = f"Monitor {monitor_id}"
-                for data in self.monitors_data:
-                    if data.get('id') == monitor_id:
-                        monitor_name = data.get('display_name', monitor_name)
-                        break
+                data = self._monitors_by_id.get(monitor_id)
+                monitor_name = data.get('display_name', f"Monitor {monitor_id}") if data else f"Monitor {monitor_id}"
                 
                 # Move app window if it's on the monitor being switched
                 self.move_app_if_on_switching_monitor(monitor_id)
                 
                 with self.monitors[monitor_id] as monitor:
                     # Convert input source name to DDC/CI code
-                    if input_source == "USB-C":
-                        input_obj = VCP_INPUT_USB_C
-                    elif input_source == "THUNDERBOLT":
-                        input_obj = VCP_INPUT_THUNDERBOLT
-                    elif input_source.startswith("INPUT_"):
-                        input_obj = int(input_source.split('_')[1])
-                    elif hasattr(InputSource, input_source):
-                        input_obj = getattr(InputSource, input_source)
-                    else:
+                    input_obj = _resolve_input_value(input_source)
+                    if input_obj is None:
                         logging.error(f"Unknown input source: {input_source}")
                         return
                     
@@ -1544,9 +1638,11 @@ class App(customtkinter.CTk):
                   or None if loading fails or file doesn't exist.
         """
         try:
-            if os.path.exists(self.shortcuts_file):
-                with open(self.shortcuts_file, 'r') as f:
-                    return json.load(f)
+            # Open directly instead of checking existence first (one syscall)
+            with open(self.shortcuts_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass  # No saved shortcuts yet
         except Exception as e:
             logging.error(f"Error loading shortcuts: {e}")
         return None
@@ -1569,16 +1665,32 @@ class App(customtkinter.CTk):
         Load favorites from JSON file.
         
         Returns:
-            dict: Dictionary mapping favorite names to (monitor_id, input_source) tuples,
-                  or None if loading fails or file doesn't exist.
+            dict: Dictionary mapping favorite names to Favorite records
+                  (malformed entries are skipped and logged), or None if
+                  the file can't be read or doesn't exist.
         """
         try:
-            if os.path.exists(self.favorites_file):
-                with open(self.favorites_file, 'r') as f:
-                    return json.load(f)
+            # Open directly instead of checking existence first (one syscall)
+            with open(self.favorites_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None  # No saved favorites yet
         except Exception as e:
             logging.error(f"Error loading favorites: {e}")
-        return None
+            return None
+        
+        # JSON stores each favorite as a [monitor_id, input_source] list;
+        # convert entry by entry so one malformed entry doesn't drop the rest
+        favorites = {}
+        try:
+            for name, value in data.items():
+                if isinstance(value, (list, tuple)) and len(value) == 2:
+                    favorites[name] = Favorite(*value)
+                else:
+                    logging.warning(f"Skipping malformed favorite '{name}': {value!r}")
+        except Exception as e:
+            logging.error(f"Error loading favorites: {e}")
+        return favorites
 
     def save_favorites(self):
         """
@@ -1602,9 +1714,11 @@ class App(customtkinter.CTk):
                   or None if loading fails or file doesn't exist.
         """
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+            # Open directly instead of checking existence first (one syscall)
+            with open(self.settings_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass  # No saved settings yet
         except Exception as e:
             logging.error(f"Error loading settings: {e}")
         return None
@@ -1622,6 +1736,39 @@ class App(customtkinter.CTk):
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
 
+    def load_monitor_cache(self):
+        """
+        Load the monitor cache from JSON file.
+        
+        Returns:
+            dict: {'pnp_ids': [...], 'monitors': {key: {'display_name',
+                  'inputs', 'ts'}}}, or None if loading fails or the file
+                  doesn't exist.
+        """
+        try:
+            with open(self.monitor_cache_file, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except FileNotFoundError:
+            pass  # No monitors cached yet
+        except Exception as e:
+            logging.error(f"Error loading monitor cache: {e}")
+        return None
+
+    def save_monitor_cache(self):
+        """
+        Save the monitor cache to JSON file.
+        
+        Nothing is written when the cache holds no monitor entries.
+        """
+        if not self._monitor_cache.get('monitors'):
+            return
+        try:
+            with open(self.monitor_cache_file, 'w') as f:
+                json.dump(self._monitor_cache, f, indent=4)
+        except Exception as e:
+            logging.error(f"Error saving monitor cache: {e}")
+
     def apply_theme(self):
         """
         Apply the current theme setting to the application.
@@ -1643,23 +1790,27 @@ class App(customtkinter.CTk):
     # DIALOG STATE MANAGEMENT
     # ==========================================================================
 
-    def _recursive_set_state(self, widget, state):
+    def _collect_descendants(self, widget):
         """
-        Recursively set the enabled/disabled state for a widget and all children.
+        Collect a widget and all of its descendants in a single traversal.
         
-        This is used to disable entire dialog windows during monitor refresh
-        to prevent users from interacting with stale data.
+        The tree is walked breadth-first with an explicit queue, so each
+        widget costs one winfo_children() Tcl round-trip and deep widget
+        hierarchies need only one Python frame.
         
         Args:
             widget: The parent widget to start from
-            state: "normal" or "disabled"
+            
+        Returns:
+            list: The widget followed by every descendant widget
         """
-        try:
-            widget.configure(state=state)
-        except Exception:
-            pass  # Not all widgets support state configuration
-        for child in widget.winfo_children():
-            self._recursive_set_state(child, state)
+        widgets = []
+        queue = deque([widget])
+        while queue:
+            w = queue.popleft()
+            widgets.append(w)
+            queue.extend(w.winfo_children())
+        return widgets
 
     def _set_toplevels_state(self, state):
         """
@@ -1669,16 +1820,57 @@ class App(customtkinter.CTk):
         editor) and disables/enables them. Used during monitor refresh
         to prevent interaction with stale data.
         
+        The widget list collected on the disable pass is kept in
+        self._toplevel_widget_cache and reused by the matching enable pass,
+        so a refresh cycle walks each dialog's tree only once. When no
+        dialog is shown (the common case) both passes return immediately.
+        
         Args:
             state: "normal" or "disabled"
         """
-        for attr in ('settings_window', 'theme_window', 'manage_window', 'editor_window'):
-            win = getattr(self, attr, None)
-            if win:
+        cache = self._toplevel_widget_cache
+        if state == 'disabled':
+            cache.clear()
+            targets = []
+            for attr in TOPLEVEL_ATTRS:
+                win = self._get_open_dialog(attr)
+                try:
+                    # Hidden (withdrawn) reusable dialogs can't be interacted with
+                    if win is not None and win.state() != 'withdrawn':
+                        targets.append((attr, win))
+                except Exception:
+                    pass
+        else:
+            # Only re-enable the dialogs the disable pass actually touched
+            targets = [(attr, cached[0]) for attr, cached in cache.items()]
+        
+        if not targets:
+            return  # No dialogs shown: skip the widget tree walk entirely
+        
+        for attr, win in targets:
+            try:
+                if state == 'disabled':
+                    widgets = self._collect_descendants(win)
+                    # Remember the tree for the re-enable pass
+                    cache[attr] = (win, widgets)
+                else:
+                    widgets = cache.pop(attr)[1]
+                    if not win.winfo_exists():
+                        continue  # Closed while the refresh was running
+                for w in widgets:
+                    try:
+                        w.configure(state=state)
+                    except Exception:
+                        pass  # Not all widgets support state configuration
+                # Show a busy cursor while disabled, then flush all queued
+                # redraws in one idle pass instead of one per widget
                 try:
-                    self._recursive_set_state(win, state)
+                    win.configure(cursor='watch' if state == 'disabled' else '')
                 except Exception:
-                    logging.debug(f"Failed to set state {state} for {attr}")
+                    pass
+                win.update_idletasks()
+            except Exception:
+                logging.debug(f"Failed to set state {state} for {attr}")
 
     # ==========================================================================
     # FAVORITES MANAGEMENT
@@ -1705,7 +1897,8 @@ class App(customtkinter.CTk):
                 return False
             
             # Add to favorites dictionary and save
-            self.favorites[name] = (monitor_id, input_source)
+            self.favorites[name] = Favorite(monitor_id, input_source)
+            self._favorites_lower[name.lower()] = name
             self.save_favorites()
             logging.info(f"Added favorite '{name}': Monitor {monitor_id} → {input_source}")
             return True
@@ -1724,8 +1917,8 @@ class App(customtkinter.CTk):
             bool: True if successfully removed, False otherwise
         """
         try:
-            if name in self.favorites:
-                del self.favorites[name]
+            if self.favorites.pop(name, None) is not None:
+                self._favorites_lower.pop(name.lower(), None)
                 self.save_favorites()
                 logging.info(f"Removed favorite '{name}'")
                 return True
@@ -1772,12 +1965,13 @@ class App(customtkinter.CTk):
             if char in name:
                 return False, f"Name cannot contain '{char}' character"
         
-        # Check for duplicates (case-insensitive comparison)
-        for existing_name in self.favorites.keys():
-            if existing_name.lower() == name.lower():
-                # Allow if we're editing this exact favorite
-                if exclude_name is None or existing_name.lower() != exclude_name.lower():
-                    return False, f"A favorite named '{existing_name}' already exists"
+        # Check for duplicates (case-insensitive, O(1) via the lowercased index)
+        name_lower = name.lower()
+        existing_name = self._favorites_lower.get(name_lower)
+        if existing_name is not None:
+            # Allow if we're editing this exact favorite
+            if exclude_name is None or name_lower != exclude_name.lower():
+                return False, f"A favorite named '{existing_name}' already exists"
         
         return True, None
 
@@ -1791,11 +1985,8 @@ class App(customtkinter.CTk):
         Returns:
             list: List of input source names (e.g., ["HDMI1", "DP1"]) or empty list
         """
-        monitors_list = self.monitors_data if hasattr(self, 'monitors_data') and self.monitors_data else []
-        for mon in monitors_list:
-            if mon.get('id') == monitor_id:
-                return mon.get('inputs', []) or []
-        return []
+        # Precomputed by _index_monitors_data() after each detection
+        return self._inputs_by_id.get(monitor_id, [])
 
     def _get_monitor_choices(self):
         """
@@ -1805,10 +1996,8 @@ class App(customtkinter.CTk):
             list: List of strings in format "ID: Display Name" 
                   (e.g., ["0: Samsung - C27G2", "1: Dell - P2419H"])
         """
-        monitors_list = self.monitors_data if hasattr(self, 'monitors_data') and self.monitors_data else []
-        if monitors_list:
-            return [f"{m.get('id')}: {m.get('display_name')}" for m in monitors_list]
-        return ["0"]
+        # Precomputed by _index_monitors_data() after each detection
+        return self._mon_choice_strings or ["0"]
 
     def _parse_monitor_selection(self, selection):
         """
@@ -1820,38 +2009,180 @@ class App(customtkinter.CTk):
         Returns:
             int: The monitor ID, or 0 if parsing fails
         """
+        # Known dropdown strings resolve with one dict lookup, no string parsing
+        mon_id = self._mon_id_by_choice.get(selection)
+        if mon_id is not None:
+            return mon_id
         try:
             return int(selection.split(':', 1)[0].strip()) if ':' in selection else int(selection)
         except (ValueError, AttributeError):
             return 0
 
-    def _center_dialog_on_parent(self, dialog, parent, width=None, height=None):
+    def _get_open_dialog(self, attr):
         """
-        Center a dialog window on its parent window.
+        Return the tracked dialog stored under attr if its window still exists.
         
-        Works correctly across multiple monitors with different positions,
-        including negative coordinates for monitors to the left of primary.
+        Dialog references are validated lazily here instead of through a
+        per-dialog <Destroy> binding; a stale reference to a destroyed
+        window is cleared and None is returned.
         
         Args:
-            dialog: The dialog window (Toplevel) to center
-            parent: The parent window to center on
-            width: Optional base width (will be scaled using UI scaler)
-            height: Optional base height (will be scaled using UI scaler)
+            attr: Attribute name used to track the dialog (e.g., 'settings_window')
+            
+        Returns:
+            The dialog window, or None if it was never built or was destroyed
         """
-        # Ensure both parent and dialog geometries are fully calculated
-        parent.update_idletasks()
-        dialog.update_idletasks()
-        
-        # Scale the provided dimensions, or use dialog's requested size
-        dlg_width = self.ui.size(width) if width else dialog.winfo_reqwidth()
-        dlg_height = self.ui.size(height) if height else dialog.winfo_reqheight()
+        dialog = getattr(self, attr, None)
+        if dialog is None:
+            return None
+        try:
+            if dialog.winfo_exists():
+                return dialog
+        except Exception:
+            pass
+        setattr(self, attr, None)
+        return None
+
+    def _reopen_dialog(self, dialog, width, height):
+        """
+        Show a previously built, hidden dialog again instead of rebuilding it.
         
-        # Get parent's absolute position on the virtual screen
-        # winfo_x/winfo_y give the window's top-left position
-        # These work correctly on multi-monitor setups including negative coordinates
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
+        Args:
+            dialog: The cached dialog window, or None if not built yet
+            width: Base width used to re-center the dialog
+            height: Base height used to re-center the dialog
+            
+        Returns:
+            bool: True if the dialog was reused, False if it must be built
+        """
+        try:
+            if dialog is None or not dialog.winfo_exists():
+                return False
+            dialog.deiconify()
+            self._center_dialog_on_parent(dialog, self, width, height)
+            dialog.lift()
+            dialog.grab_set()  # Block interaction with parent again
+            return True
+        except Exception:
+            return False
+
+    def _hide_dialog(self, dialog):
+        """
+        Hide a reusable dialog so the next open can skip widget construction.
+        
+        The modal grab is released first so the hidden dialog does not keep
+        blocking the main window. Child dialogs (e.g. the favorite editor)
+        are destroyed rather than hidden along with it. A dialog built at a
+        display scaling that has since changed is destroyed instead, so the
+        next open rebuilds it at the current size.
+        
+        Args:
+            dialog: The dialog window (Toplevel) to hide
+        """
+        try:
+            dialog.grab_release()
+        except Exception:
+            pass
+        if dialog in self._stale_dialogs:
+            self._stale_dialogs.discard(dialog)
+            dialog.destroy()
+            return
+        for child in dialog.winfo_children():
+            if isinstance(child, customtkinter.CTkToplevel):
+                child.destroy()
+        dialog.withdraw()
+
+    def _sync_row_pool(self, pool, items, build_fn, update_fn, show_fn=None, hide_fn=None):
+        """
+        Display items using a pool of reusable row widgets.
+        
+        Row i shows items[i]: existing rows are updated in place, new rows
+        are only built once the pool runs out, and rows past the end of
+        items are hidden (kept for reuse) rather than destroyed.
+        
+        Args:
+            pool: List of rows, extended in place with newly built rows
+            items: Sequence of values to display, in order
+            build_fn: build_fn(item) -> new row
+            update_fn: update_fn(row, item) refreshes a reused row
+            show_fn: show_fn(row, index) maps a row; by default an unmapped
+                     row['frame'] is packed. Rows are only ever hidden from
+                     the tail of the pool, so re-packing keeps the order.
+            hide_fn: hide_fn(row) unmaps a surplus row; by default
+                     row['frame'].pack_forget()
+        """
+        for i, item in enumerate(items):
+            if i < len(pool):
+                row = pool[i]
+                update_fn(row, item)
+            else:
+                row = build_fn(item)
+                pool.append(row)
+            if show_fn is not None:
+                show_fn(row, i)
+            elif not row['frame'].winfo_manager():
+                row['frame'].pack(fill="x", pady=3)
+        
+        # Hide rows left over from a previously longer list
+        for row in pool[len(items):]:
+            if hide_fn is not None:
+                hide_fn(row)
+            else:
+                row['frame'].pack_forget()
+
+    def _discard_cached_dialogs(self):
+        """
+        Drop reusable dialogs built at the previous display scaling.
+        
+        Hidden dialogs are destroyed right away; a dialog that is open is
+        marked stale and destroyed by _hide_dialog() when it is closed.
+        Either way the next open rebuilds it with the current sizes.
+        """
+        for attr in REUSABLE_DIALOG_ATTRS:
+            dialog = self._get_open_dialog(attr)
+            if dialog is None:
+                continue
+            try:
+                if dialog.state() == 'withdrawn':
+                    dialog.destroy()
+                    setattr(self, attr, None)
+                    if attr == 'manage_window':
+                        # Pooled favorites rows died with the dialog
+                        self._mf_row_pool = []
+                        self._mf_empty_label = None
+                        self._mf_list_fp = None
+                else:
+                    self._stale_dialogs.add(dialog)
+            except Exception as e:
+                logging.debug(f"Could not discard cached dialog {attr}: {e}")
+
+    def _center_dialog_on_parent(self, dialog, parent, width=None, height=None):
+        """
+        Center a dialog window on its parent window.
+        
+        Works correctly across multiple monitors with different positions,
+        including negative coordinates for monitors to the left of primary.
+        
+        Args:
+            dialog: The dialog window (Toplevel) to center
+            parent: The parent window to center on
+            width: Optional base width (will be scaled using UI scaler)
+            height: Optional base height (will be scaled using UI scaler)
+        """
+        # Ensure both parent and dialog geometries are fully calculated
+        parent.update_idletasks()
+        dialog.update_idletasks()
+        
+        # Scale the provided dimensions, or use dialog's requested size
+        dlg_width = self.ui.size(width) if width else dialog.winfo_reqwidth()
+        dlg_height = self.ui.size(height) if height else dialog.winfo_reqheight()
+        
+        # Get parent's absolute position on the virtual screen
+        # winfo_x/winfo_y give the window's top-left position
+        # These work correctly on multi-monitor setups including negative coordinates
+        parent_x = parent.winfo_x()
+        parent_y = parent.winfo_y()
+        parent_width = parent.winfo_width()
         parent_height = parent.winfo_height()
         
         # Calculate center position relative to parent
@@ -1876,63 +2207,46 @@ class App(customtkinter.CTk):
         Returns:
             bool: True if successfully switched, False otherwise
         """
+        _set_status = self.status_label.configure
         try:
-            # Validate favorite exists
-            if name not in self.favorites:
-                self.status_label.configure(text=f"❌ Favorite '{name}' not found")
+            # Validate favorite exists (single lookup)
+            entry = self.favorites.get(name)
+            if entry is None:
+                _set_status(text=f"❌ Favorite '{name}' not found")
                 return False
 
-            monitor_id, input_source = self.favorites[name]
+            monitor_id = entry.monitor_id
+            input_source = entry.input_source
 
             # Validate monitor exists
-            if monitor_id >= len(self.monitors):
-                self.status_label.configure(text=f"❌ Monitor {monitor_id} not found")
+            if monitor_id >= self._monitor_count:
+                _set_status(text=f"❌ Monitor {monitor_id} not found")
                 return False
 
             # Get monitor display name for status message
-            monitor_name = f"Monitor {monitor_id}"
-            for data in self.monitors_data:
-                if data.get('id') == monitor_id:
-                    monitor_name = data.get('display_name', monitor_name)
-                    break
+            data = self._monitors_by_id.get(monitor_id)
+            monitor_name = data.get('display_name', f"Monitor {monitor_id}") if data else f"Monitor {monitor_id}"
 
             # Move app if it's on the monitor being switched
             self.move_app_if_on_switching_monitor(monitor_id)
 
-            # Convert input_source string to DDC/CI code
-            input_obj = None
-            # Normalize the input source string (handle USB-C, THUNDERBOLT, etc.)
-            normalized = input_source.replace("-", "_").replace(" ", "_").upper()
-            
-            if hasattr(InputSource, normalized):
-                # Standard InputSource enum attribute
-                input_obj = getattr(InputSource, normalized)
-            elif input_source.upper() == "USB-C":
-                # Fallback to known code for USB-C
-                input_obj = VCP_INPUT_USB_C  # 27
-            elif input_source.upper() == "THUNDERBOLT":
-                input_obj = VCP_INPUT_THUNDERBOLT  # 26
-            else:
-                # Try to parse as int code (e.g., INPUT_27)
-                try:
-                    if input_source.startswith("INPUT_"):
-                        input_obj = int(input_source.split("_")[-1])
-                except Exception:
-                    pass
+            # Convert input_source string to DDC/CI code, tolerating case and
+            # separator differences in saved favorites (e.g. "usb-c")
+            input_obj = _resolve_input_value(input_source, lenient=True)
 
             # Send DDC/CI command
             with self.monitors[monitor_id] as monitor:
                 if input_obj is not None:
                     monitor.set_input_source(input_obj)
-                    self.status_label.configure(text=f"✅ {monitor_name}: Switched to '{name}'")
+                    _set_status(text=f"✅ {monitor_name}: Switched to '{name}'")
                     logging.info(f"Switched {monitor_name} to favorite '{name}'")
                     return True
                 else:
-                    self.status_label.configure(text=f"❌ Unknown input source '{input_source}'")
+                    _set_status(text=f"❌ Unknown input source '{input_source}'")
                     logging.error(f"Unknown input source '{input_source}' for favorite '{name}'")
                     return False
         except Exception as e:
-            self.status_label.configure(text=f"❌ Error: {str(e)[:40]}")
+            _set_status(text=f"❌ Error: {str(e)[:40]}")
             logging.error(f"Error switching to favorite '{name}': {e}")
             return False
 
@@ -1963,12 +2277,11 @@ class App(customtkinter.CTk):
             self.shortcuts[shortcut_key] = (monitor_id, input_source)
             self.save_shortcuts()
             
-            # Re-register all hotkeys (clear and recreate)
+            # Register (or re-bind) just this hotkey instead of rebuilding all
             try:
-                keyboard.clear_all_hotkeys()
-            except Exception:
-                pass
-            self.setup_global_hotkeys()
+                self._register_hotkey(shortcut_key, monitor_id, input_source)
+            except Exception as e:
+                logging.error(f"Failed to register hotkey {shortcut_key}: {e}")
 
             logging.info(f"Added shortcut {shortcut_key} -> Monitor {monitor_id} : {input_source}")
             return True
@@ -1980,59 +2293,73 @@ class App(customtkinter.CTk):
         """
         Rebuild the favorites buttons grid in the main window.
         
-        This method clears and recreates all favorite buttons based on
-        the current favorites dictionary. Buttons are arranged in a
-        responsive grid layout with up to 4 columns.
+        Buttons are arranged in a responsive grid layout with up to 4 columns.
+        Existing buttons are kept in self._fav_button_pool and updated in
+        place; new buttons are only created when the number of favorites
+        grows, and surplus buttons are hidden with grid_forget().
         
         The favorites section height is dynamically adjusted based on
         the number of favorites (minimal height when empty).
         """
-        # Clear existing buttons
-        for widget in self.favorites_scroll.winfo_children():
-            widget.destroy()
+        pool = self._fav_button_pool
         
         if not self.favorites:
+            # Hide all pooled buttons before packing the placeholder
+            # (pack and grid cannot manage children of the same frame at once)
+            for btn in pool:
+                btn.grid_forget()
+            
             # When empty, show placeholder text and keep minimal height
-            no_fav = customtkinter.CTkLabel(
-                self.favorites_scroll,
-                text="Click 'Manage' to add favorites",
-                text_color="gray",
-                font=self.ui.font("Arial", 10)
-            )
-            no_fav.pack(pady=self.ui.size(8))
+            if self._fav_placeholder is None:
+                self._fav_placeholder = customtkinter.CTkLabel(
+                    self.favorites_scroll,
+                    text="Click 'Manage' to add favorites",
+                    text_color="gray",
+                    font=self.ui.font("Arial", 10)
+                )
+            self._fav_placeholder.pack(pady=self.ui.size(8))
             # Keep minimal height when empty
             self.favorites_scroll.configure(height=self.ui.size(40))
             return
         
+        if self._fav_placeholder is not None:
+            self._fav_placeholder.pack_forget()
+        
         # Layout favorites in a responsive grid
-        total = len(self.favorites)
         max_cols = 4  # Maximum columns per row
-        row = 0
-        col = 0
-
-        for fav_name in self.favorites.keys():
-            # Create button for each favorite
-            fav_btn = customtkinter.CTkButton(
+        
+        # Set the final height up front from the favorite count, so the frame
+        # is resized once before any buttons are gridded
+        fav_count = len(self.favorites)
+        rows = max(1, (fav_count + max_cols - 1) // max_cols)
+        per_row_height = self.ui.size(48)
+        self.favorites_scroll.configure(height=self.ui.size(20) + rows * per_row_height)
+        
+        def build_button(fav_name):
+            return customtkinter.CTkButton(
                 self.favorites_scroll,
                 text=fav_name,
-                command=lambda n=fav_name: self.switch_to_favorite(n),
+                command=functools.partial(self.switch_to_favorite, fav_name),
                 height=self.ui.size(36),
                 font=self.ui.font("Arial", 11)
             )
-            fav_btn.grid(row=row, column=col, padx=self.ui.size(6), pady=self.ui.size(6), sticky="ew")
 
-            # Move to next column, wrap to next row if needed
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        def update_button(fav_btn, fav_name):
+            # Touch a reused button only if its favorite changed
+            if fav_btn.cget("text") != fav_name:
+                fav_btn.configure(
+                    text=fav_name,
+                    command=functools.partial(self.switch_to_favorite, fav_name)
+                )
 
-        # Calculate and set appropriate height based on number of rows
-        rows = row + (1 if col > 0 else 0)
-        rows = max(1, rows)
-        per_row_height = self.ui.size(48)
-        new_height = self.ui.size(20) + rows * per_row_height
-        self.favorites_scroll.configure(height=new_height)
+        def show_button(fav_btn, i):
+            # Fill the grid row by row, wrapping after max_cols columns
+            fav_btn.grid(row=i // max_cols, column=i % max_cols,
+                         padx=self.ui.size(6), pady=self.ui.size(6), sticky="ew")
+
+        # Only the favorite names are needed here
+        self._sync_row_pool(pool, list(self.favorites), build_button, update_button,
+                            show_button, lambda fav_btn: fav_btn.grid_forget())
 
         # Configure column weights for equal sizing
         for i in range(max_cols):
@@ -2054,7 +2381,14 @@ class App(customtkinter.CTk):
         
         The dialog is modal (transient) and centered on the parent window.
         Changes are only saved when the user clicks "Save".
+        
+        The dialog is built on first open and hidden (not destroyed) on close;
+        later opens re-show it and reload the radio selection from settings.
         """
+        if self._reopen_dialog(self._get_open_dialog('settings_window'), 460, 420):
+            self.tray_radio_var.set(self.settings.get("tray_on", "none"))
+            return
+        
         settings_window = customtkinter.CTkToplevel(self)
         # Track this window so it can be disabled during refresh
         self.settings_window = settings_window
@@ -2063,8 +2397,8 @@ class App(customtkinter.CTk):
         settings_window.transient(self)  # Make dialog modal
         settings_window.grab_set()       # Block interaction with parent
         self._center_dialog_on_parent(settings_window, self, 460, 420)
-        # Clear reference when window is destroyed
-        settings_window.bind('<Destroy>', lambda e: setattr(self, 'settings_window', None))
+        # Closing hides the dialog so it can be reused
+        settings_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(settings_window))
         
         frame = customtkinter.CTkFrame(settings_window)
         frame.pack(fill="both", expand=True, padx=self.ui.size(20), pady=self.ui.size(20))
@@ -2082,10 +2416,10 @@ class App(customtkinter.CTk):
         tray_title = customtkinter.CTkLabel(tray_frame, text=" Window Behavior", font=self.ui.font("Arial", 14, "bold"))
         tray_title.pack(anchor="w", pady=(0, 3))
         
-        # Pick readable text colors based on current appearance mode
-        appearance = customtkinter.get_appearance_mode()
-        normal_text_color = "#000000" if appearance == "Light" else "#EDEDED"
-        note_text_color = "#000000" if appearance == "Light" else "#EDEDED"
+        # Readable text colors as (light, dark) pairs so they stay correct
+        # if the theme changes while the dialog is cached
+        normal_text_color = ("#000000", "#EDEDED")
+        note_text_color = ("#000000", "#EDEDED")
 
         tray_desc = customtkinter.CTkLabel(
             tray_frame, 
@@ -2097,8 +2431,6 @@ class App(customtkinter.CTk):
         
         # Get current setting (default to normal Windows behavior)
         tray_on = self.settings.get("tray_on", "none")
-        # Store original value to restore on cancel
-        original_tray_on = tray_on
         self.tray_radio_var = customtkinter.StringVar(value=tray_on)
         
         # Radio button options for tray behavior
@@ -2174,7 +2506,7 @@ class App(customtkinter.CTk):
                     messagebox.showinfo("Success", "Settings saved!", parent=settings_window)
                 except Exception:
                     pass
-                settings_window.destroy()
+                self._hide_dialog(settings_window)
             except Exception as e:
                 logging.error(f"Failed to save settings: {e}")
                 try:
@@ -2188,9 +2520,9 @@ class App(customtkinter.CTk):
 
         def cancel_settings():
             """Cancel changes and close dialog."""
-            # Restore original value (no changes saved)
-            self.tray_radio_var.set(original_tray_on)
-            settings_window.destroy()
+            # Restore saved value (no changes saved)
+            self.tray_radio_var.set(self.settings.get("tray_on", "none"))
+            self._hide_dialog(settings_window)
 
         cancel_btn = customtkinter.CTkButton(
             center_frame,
@@ -2198,8 +2530,7 @@ class App(customtkinter.CTk):
             command=cancel_settings,
             height=self.ui.size(36),
             width=self.ui.size(110),
-            fg_color=("#D32F2F", "#C62828"),
-            hover_color=("#C62828", "#B71C1C")
+            **DANGER_BUTTON_STYLE
         )
         cancel_btn.pack(side="left", padx=self.ui.size(8))
 
@@ -2212,7 +2543,14 @@ class App(customtkinter.CTk):
         
         Allows users to choose between Dark, Light, and System themes.
         "System" follows the Windows light/dark mode setting automatically.
+        
+        The dialog is built on first open and hidden (not destroyed) on close.
         """
+        if self._reopen_dialog(self._get_open_dialog('theme_window'), 320, 260):
+            self.theme_var.set(self.settings.get("theme", "dark"))
+            set_dark_title_bar(self.theme_window)  # Theme may have changed
+            return
+        
         theme_window = customtkinter.CTkToplevel(self)
         # Track open theme dialog for disabling during refresh
         self.theme_window = theme_window
@@ -2221,7 +2559,7 @@ class App(customtkinter.CTk):
         theme_window.transient(self)  # Make dialog modal
         theme_window.grab_set()       # Block interaction with parent
         self._center_dialog_on_parent(theme_window, self, 320, 260)
-        theme_window.bind('<Destroy>', lambda e: setattr(self, 'theme_window', None))
+        theme_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(theme_window))
         set_dark_title_bar(theme_window)  # Apply dark title bar if in dark mode
         
         frame = customtkinter.CTkFrame(theme_window)
@@ -2232,7 +2570,7 @@ class App(customtkinter.CTk):
         
         # Get current theme setting
         current_theme = self.settings.get("theme", "dark")
-        theme_var = customtkinter.StringVar(value=current_theme)
+        self.theme_var = theme_var = customtkinter.StringVar(value=current_theme)
         
         # Theme options with display labels
         theme_labels = {
@@ -2262,7 +2600,7 @@ class App(customtkinter.CTk):
             self.save_settings()
             self.apply_theme()
             self.status_label.configure(text="✅ Theme changed successfully")
-            theme_window.destroy()
+            self._hide_dialog(theme_window)
 
         # Center the buttons
         center_frame = customtkinter.CTkFrame(btn_frame, fg_color="transparent")
@@ -2271,11 +2609,10 @@ class App(customtkinter.CTk):
         cancel_btn = customtkinter.CTkButton(
             center_frame,
             text="Cancel",
-            command=theme_window.destroy,
+            command=lambda: self._hide_dialog(theme_window),
             height=self.ui.size(36),
             width=self.ui.size(110),
-            fg_color=("#D32F2F", "#C62828"),
-            hover_color=("#C62828", "#B71C1C")
+            **DANGER_BUTTON_STYLE
         )
         cancel_btn.pack(side="left", padx=self.ui.size(8))
 
@@ -2285,8 +2622,7 @@ class App(customtkinter.CTk):
             command=apply_settings,
             height=self.ui.size(36),
             width=self.ui.size(110),
-            fg_color=("#2B7A0B", "#5FB041"),
-            hover_color=("#246A09", "#52A038")
+            **APPLY_BUTTON_STYLE
         )
         apply_btn.pack(side="left", padx=self.ui.size(8))
 
@@ -2308,7 +2644,6 @@ class App(customtkinter.CTk):
         if getattr(self, '_loading_monitors', False):
             return
         
-        import time
         current_time = time.time()
         
         # Reset counter if more than 0.4 seconds since last click (must click rapidly)
@@ -2488,7 +2823,7 @@ class App(customtkinter.CTk):
             text="✨ Pergi sambung kerja!! ✨",
             command=on_close,
             height=36,
-            font=("Arial", 12, "bold"),
+            font=FONT_BOLD,
             fg_color="#9B59B6",
             hover_color="#8E44AD"
         )
@@ -2541,6 +2876,57 @@ class App(customtkinter.CTk):
         if tray_on in ["minimize", "both"]:
             # Minimize button hides to tray instead of taskbar
             self.bind("<Unmap>", self.on_minimize)
+        
+        # Build the tray icon ahead of time so the first hide is instant
+        if tray_on != "none":
+            self._schedule_tray_icon()
+    
+    def _schedule_tray_icon(self):
+        """
+        Start preparing the tray icon resources on a background daemon thread.
+        
+        Importing pystray/PIL and drawing the icon image would otherwise
+        stall the Tk event loop on the first minimize_to_tray() call.
+        Does nothing if the icon exists or is already being prepared.
+        
+        Only the imports and the image are prepared here; the Icon itself
+        is built in minimize_to_tray(), because on Windows pystray creates
+        its hidden message window in Icon.__init__ and that window dies
+        with the short-lived worker thread that created it.
+        """
+        if (self.tray_icon is not None or self._tray_icon_img is not None
+                or self._tray_image_thread is not None):
+            return
+        # daemon=True, like the monitor detection thread, so it never blocks exit
+        self._tray_image_thread = threading.Thread(target=self._warm_tray_icon_image, daemon=True)
+        self._tray_image_thread.start()
+    
+    def _warm_tray_icon_image(self):
+        """Draw and cache the tray icon image (runs on _tray_image_thread)."""
+        try:
+            self.create_tray_icon_image()
+        except Exception as e:
+            logging.debug(f"Background tray icon preparation failed: {e}")
+    
+    def _build_tray_icon(self):
+        """
+        Build the pystray Icon with its context menu (not yet running).
+        
+        Must be called on a long-lived thread (the Tk main thread), see
+        _schedule_tray_icon().
+        
+        Returns:
+            pystray.Icon: The tray icon, ready to be started with run()
+        """
+        Icon, Menu, MenuItem, _, _ = _tray_modules()
+        
+        # Create tray icon with context menu
+        icon_image = self.create_tray_icon_image()
+        menu = Menu(
+            MenuItem('Show', self.show_window),   # Show the main window
+            MenuItem('Quit', self.quit_app)       # Exit the application
+        )
+        return Icon("Monitor Manager", icon_image, "Monitor Input Switcher", menu)
     
     def create_tray_icon_image(self):
         """
@@ -2548,10 +2934,16 @@ class App(customtkinter.CTk):
         
         Draws a 64x64 pixel icon depicting a monitor shape.
         The icon is white background with black monitor outline.
+        The image is static, so it is drawn once and cached on the app.
         
         Returns:
             PIL.Image: The generated icon image
         """
+        if self._tray_icon_img is not None:
+            return self._tray_icon_img
+        
+        _, _, _, Image, ImageDraw = _tray_modules()
+        
         # Create a 64x64 white background image
         width = 64
         height = 64
@@ -2568,6 +2960,7 @@ class App(customtkinter.CTk):
         # Monitor stand (base)
         dc.rectangle([20, 48, 44, 52], fill='black', outline='black')
         
+        self._tray_icon_img = image
         return image
     
     def minimize_to_tray(self):
@@ -2576,18 +2969,19 @@ class App(customtkinter.CTk):
         
         Withdraws the window from view and creates a system tray icon
         if one doesn't already exist. The tray icon provides a menu
-        to show the window or quit the application.
+        to show the window or quit the application. The modules and
+        image prepared earlier by _schedule_tray_icon() are reused.
         """
         self.withdraw()  # Hide the window from taskbar and screen
         
         if self.tray_icon is None:
-            # Create tray icon with context menu
-            icon_image = self.create_tray_icon_image()
-            menu = Menu(
-                MenuItem('Show', self.show_window),   # Show the main window
-                MenuItem('Quit', self.quit_app)       # Exit the application
-            )
-            self.tray_icon = Icon("Monitor Manager", icon_image, "Monitor Input Switcher", menu)
+            # Wait for the background imports/image if they are in flight;
+            # on failure _build_tray_icon() simply redoes the work here
+            if self._tray_image_thread is not None:
+                self._tray_image_thread.join()
+                self._tray_image_thread = None
+            # Built on the Tk thread so its window outlives the worker
+            self.tray_icon = self._build_tray_icon()
             
             # Run tray icon in a separate daemon thread
             # daemon=True ensures the thread terminates when the main app exits
@@ -2604,13 +2998,23 @@ class App(customtkinter.CTk):
         Args:
             event: Tkinter event object
         """
-        # Check if the window state changed to iconic (minimized)
-        if event.widget == self and self.state() == 'iconic':
-            # Only minimize to tray if setting allows it
-            tray_on = self.settings.get("tray_on", "none")
-            if tray_on in ["minimize", "both"]:
-                # Use after() to avoid issues with event handling
-                self.after(10, self.minimize_to_tray)
+        # <Unmap> also fires for child widgets and for non-minimize state changes
+        # (docking, virtual desktop switches), so bail out early on those
+        if event.widget != self or self.state() != 'iconic':
+            return
+
+        # Debounce: the window manager can deliver several <Unmap> events for a
+        # single minimize; only schedule one hide-to-tray per 200ms window
+        now = time.monotonic()
+        if now - self._last_unmap_ts < 0.2:
+            return
+        self._last_unmap_ts = now
+
+        # Only minimize to tray if setting allows it
+        tray_on = self.settings.get("tray_on", "none")
+        if tray_on in ["minimize", "both"]:
+            # Use after() to avoid issues with event handling
+            self.after(10, self.minimize_to_tray)
     
     def _on_window_configure(self, event):
         """
@@ -2655,6 +3059,19 @@ class App(customtkinter.CTk):
             customtkinter.set_widget_scaling(self.ui.scale)
             customtkinter.set_window_scaling(self.ui.scale)
             
+            # Cached dialogs keep the ui.size() geometry they were built with
+            self._discard_cached_dialogs()
+            
+            # Pooled favorite buttons (and the placeholder) were sized with
+            # the old scale too; rebuild them at the new one
+            for fav_btn in self._fav_button_pool:
+                fav_btn.destroy()
+            self._fav_button_pool.clear()
+            if self._fav_placeholder is not None:
+                self._fav_placeholder.destroy()
+                self._fav_placeholder = None
+            self.refresh_favorites_buttons()
+            
             # Update status to inform user
             self.status_label.configure(text=f"🖥️ Display scaling updated ({self.ui.scale:.0%})")
     
@@ -2705,7 +3122,16 @@ class App(customtkinter.CTk):
         - Add new favorites
         
         The favorites list dynamically resizes based on the number of items.
+        
+        The dialog is built on first open and hidden (not destroyed) on close;
+        later opens refresh the monitor choices and favorites list in place.
+        Its callbacks are the _mf_* methods below, bound with functools.partial
+        where they need arguments.
         """
+        if self._reopen_dialog(self._get_open_dialog('manage_window'), 450, 500):
+            self._mf_reload()
+            return
+        
         manage_window = customtkinter.CTkToplevel(self)
         # Track this window for temporary disabling during refresh
         self.manage_window = manage_window
@@ -2714,10 +3140,11 @@ class App(customtkinter.CTk):
         manage_window.transient(self)  # Make dialog modal
         manage_window.grab_set()       # Block interaction with parent
         self._center_dialog_on_parent(manage_window, self, 450, 500)
-        manage_window.bind('<Destroy>', lambda e: setattr(self, 'manage_window', None))
+        manage_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(manage_window))
         
         main_frame = customtkinter.CTkFrame(manage_window)
         main_frame.pack(fill="both", expand=True, padx=15, pady=15)
+        self._mf_main_frame = main_frame
         
         title = customtkinter.CTkLabel(main_frame, text="⭐ Manage Favorite Setups", font=("Arial", 16, "bold"))
         title.pack(pady=(0, 15))
@@ -2730,295 +3157,385 @@ class App(customtkinter.CTk):
         fav_section = customtkinter.CTkFrame(main_frame)
         fav_section.pack(fill="x", expand=False, pady=(0, 15))
         
-        fav_header = customtkinter.CTkLabel(fav_section, text="Current Favorites:", font=("Arial", 12, "bold"))
+        fav_header = customtkinter.CTkLabel(fav_section, text="Current Favorites:", font=FONT_BOLD)
         fav_header.pack(anchor="w", padx=12, pady=(12, 8))
         
         # Frame for favorites list (height adjusts dynamically)
         favorites_list_frame = customtkinter.CTkFrame(fav_section, height=60)
         favorites_list_frame.pack(fill="x", expand=False, padx=12, pady=(0, 12))
         favorites_list_frame.pack_propagate(False)
-        
-        def update_favorites_list():
-            """Rebuild the favorites list display."""
-            # Clear existing items
-            for widget in favorites_list_frame.winfo_children():
-                widget.destroy()
-            
-            if not self.favorites:
-                # Show placeholder when no favorites exist
-                empty_label = customtkinter.CTkLabel(favorites_list_frame, text="No favorites saved yet.", text_color="gray")
-                empty_label.pack(pady=20)
-                favorites_list_frame.configure(height=60)
-            else:
-                # Calculate height based on number of favorites (each item ~45px)
-                num_favorites = len(self.favorites)
-                new_height = min(60 + (num_favorites * 45), 250)  # Cap at 250px
-                favorites_list_frame.configure(height=new_height)
-                
-                # Create a row for each favorite
-                for fav_name, (monitor_id, input_source) in self.favorites.items():
-                    fav_frame = customtkinter.CTkFrame(favorites_list_frame)
-                    fav_frame.pack(fill="x", pady=3)
-                    
-                    # Get monitor display name
-                    try:
-                        mon = next((m for m in self.monitors_data if m.get('id') == monitor_id), None)
-                        display_name = mon.get('display_name', f"Monitor {monitor_id}") if mon else f"Monitor {monitor_id}"
-                    except Exception:
-                        display_name = f"Monitor {monitor_id}"
-                    
-                    # Label showing: FavoriteName: MonitorName → InputSource
-                    label_text = f"{fav_name}: {display_name} → {input_source}"
-                    label = customtkinter.CTkLabel(fav_frame, text=label_text, font=("Arial", 11))
-                    label.pack(side="left", padx=8, pady=6)
-
-                    # Delete button (red)
-                    delete_btn = customtkinter.CTkButton(
-                        fav_frame, text="Delete", width=70, height=28,
-                        command=lambda n=fav_name: delete_favorite(n),
-                        fg_color=("#D32F2F", "#C62828"),
-                        hover_color=("#C62828", "#B71C1C")
-                    )
-                    delete_btn.pack(side="right", padx=8)
-
-                    # Edit button (blue)
-                    edit_btn = customtkinter.CTkButton(
-                        fav_frame, text="Edit", width=70, height=28,
-                        command=lambda n=fav_name: edit_favorite(n),
-                        fg_color=("#1976D2", "#1565C0"),
-                        hover_color=("#1565C0", "#0D47A1")
-                    )
-                    edit_btn.pack(side="right", padx=8)
-            
-            # Dynamically adjust window height based on content
-            manage_window.update_idletasks()
-            required_height = main_frame.winfo_reqheight() + 30
-            manage_window.geometry(f"480x{required_height}")
-        
-        def delete_favorite(name):
-            """Delete a favorite after confirmation."""
-            try:
-                try:
-                    confirm = messagebox.askyesno("Confirm Delete", f"Delete favorite '{name}'?", parent=manage_window)
-                except Exception:
-                    confirm = True
-
-                if not confirm:
-                    return
-
-                if self.remove_favorite(name):
-                    update_favorites_list()
-                    self.refresh_favorites_buttons()
-                    try:
-                        messagebox.showinfo("Success", f"Favorite '{name}' removed!", parent=manage_window)
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        messagebox.showerror("Error", f"Failed to remove favorite '{name}'", parent=manage_window)
-                    except Exception:
-                        pass
-            except Exception as e:
-                logging.error(f"Failed to remove favorite {name}: {e}")
-
-        def edit_favorite(name):
-            """
-            Open an edit dialog to modify a favorite's name, monitor, or input.
-            
-            Uses helper methods to reduce code duplication with the add favorite form.
-            """
-            current = self.favorites.get(name)
-            if not current:
-                messagebox.showerror("Error", f"Favorite '{name}' not found", parent=manage_window)
-                return
-
-            try:
-                monitor_id, input_source = current
-            except Exception:
-                monitor_id, input_source = 0, "HDMI1"
-
-            # Create edit dialog
-            edit_win = customtkinter.CTkToplevel(manage_window)
-            edit_win.title(f"Edit Favorite - {name}")
-            edit_win.transient(manage_window)
-            edit_win.grab_set()
-            edit_win.resizable(False, False)
-            self._center_dialog_on_parent(edit_win, manage_window, 350, 220)
-
-            frm = customtkinter.CTkFrame(edit_win)
-            frm.pack(fill="both", expand=True, padx=12, pady=12)
-
-            # Name
-            name_label2 = customtkinter.CTkLabel(frm, text="Name:", font=("Arial", 11))
-            name_label2.grid(row=0, column=0, sticky="w", pady=(0, 8))
-            name_var2 = customtkinter.StringVar(value=name)
-            
-            # Limit name entry to 20 characters
-            def limit_name_length2(*args):
-                value = name_var2.get()
-                if len(value) > 20:
-                    name_var2.set(value[:20])
-            name_var2.trace_add('write', limit_name_length2)
-            
-            name_entry2 = customtkinter.CTkEntry(frm, textvariable=name_var2, height=32)
-            name_entry2.grid(row=0, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
-
-            # Monitor - using helper method
-            mon_label2 = customtkinter.CTkLabel(frm, text="Monitor:", font=("Arial", 11))
-            mon_label2.grid(row=1, column=0, sticky="w", pady=(0, 8))
-
-            mon_choices = self._get_monitor_choices()
-            default_mon_str = next((s for s in mon_choices if s.startswith(str(monitor_id) + ":")), mon_choices[0])
-
-            mon_var2 = customtkinter.StringVar(value=default_mon_str)
-            mon_menu2 = customtkinter.CTkOptionMenu(frm, variable=mon_var2, values=mon_choices, height=32)
-            mon_menu2.grid(row=1, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
-
-            # Input - using helper method
-            input_label2 = customtkinter.CTkLabel(frm, text="Input:", font=("Arial", 11))
-            input_label2.grid(row=2, column=0, sticky="w", pady=(0, 8))
-
-            sel_id_init = self._parse_monitor_selection(default_mon_str)
-            inputs_list2 = self._get_inputs_for_monitor(sel_id_init) or ["DP1", "HDMI1", "DP2", "HDMI2"]
-            input_var2 = customtkinter.StringVar(value=input_source if input_source in inputs_list2 else (inputs_list2[0] if inputs_list2 else "HDMI1"))
-            input_menu2 = customtkinter.CTkOptionMenu(frm, variable=input_var2, values=inputs_list2, height=32)
-            input_menu2.grid(row=2, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
-
-            frm.grid_columnconfigure(1, weight=1)
-
-            def update_input_options2(*args):
-                sel_id = self._parse_monitor_selection(mon_var2.get())
-                new_inputs = self._get_inputs_for_monitor(sel_id) or ["DP1", "HDMI1", "DP2", "HDMI2"]
-                try:
-                    input_menu2.configure(values=new_inputs)
-                    input_var2.set(new_inputs[0])
-                except Exception:
-                    pass
-
-            mon_var2.trace_add('write', update_input_options2)
-
-            def save_edit():
-                newname = name_var2.get().strip()
-                
-                # FIX #7: Use validation helper method
-                is_valid, error_msg = self._validate_favorite_name(newname, exclude_name=name)
-                if not is_valid:
-                    messagebox.showerror("Validation Error", error_msg, parent=edit_win)
-                    try:
-                        name_entry2.focus_set()
-                        name_entry2.select_range(0, 'end')
-                    except Exception:
-                        pass
-                    return
-
-                monitor_id_new = self._parse_monitor_selection(mon_var2.get())
-                input_new = input_var2.get()
-
-                try:
-                    if newname != name and name in self.favorites:
-                        del self.favorites[name]
-                    self.favorites[newname] = (monitor_id_new, input_new)
-                    self.save_favorites()
-                    update_favorites_list()
-                    self.refresh_favorites_buttons()
-                    messagebox.showinfo("Success", f"Favorite '{newname}' saved!", parent=edit_win)
-                    edit_win.destroy()
-                except Exception as e:
-                    logging.error(f"Failed to save edited favorite: {e}")
-                    messagebox.showerror("Error", "Failed to save favorite", parent=edit_win)
-
-            btn_frame = customtkinter.CTkFrame(frm, fg_color='transparent')
-            btn_frame.grid(row=3, column=0, columnspan=2, sticky='ew', pady=(10, 0))
-
-            save_btn = customtkinter.CTkButton(btn_frame, text="💾 Save", command=save_edit, height=36, width=100, fg_color="#28a745", hover_color="#218838")
-            save_btn.pack(side="right", padx=(0, 6))
-
-            cancel_btn = customtkinter.CTkButton(btn_frame, text="Cancel", command=edit_win.destroy, height=36, width=100, fg_color="#dc3545", hover_color="#c82333")
-            cancel_btn.pack(side="right", padx=(0, 6))
-
-            # Make the edit dialog a bit larger (but smaller than Manage Favorites)
-            edit_win.update_idletasks()
-            req_w = max(360, min(440, frm.winfo_reqwidth() + 60))
-            req_h = frm.winfo_reqheight() + 40
-            edit_win.geometry(f"{req_w}x{req_h}")
+        self._mf_list_frame = favorites_list_frame
         
         # Add new favorite section
         # FIX #6: Refactored to use helper methods, reducing duplicate code
         add_section = customtkinter.CTkFrame(main_frame)
         add_section.pack(fill="x", pady=(0, 0))
         
-        add_header = customtkinter.CTkLabel(add_section, text="Add New Favorite:", font=("Arial", 12, "bold"))
+        add_header = customtkinter.CTkLabel(add_section, text="Add New Favorite:", font=FONT_BOLD)
         add_header.pack(anchor="w", padx=12, pady=(12, 8))
         
         form_frame = customtkinter.CTkFrame(add_section, fg_color="transparent")
         form_frame.pack(fill="x", padx=12, pady=(0, 12))
         
         # Name input
-        name_label = customtkinter.CTkLabel(form_frame, text="Name:", font=("Arial", 11))
+        name_label = customtkinter.CTkLabel(form_frame, text="Name:", font=FONT_SMALL)
         name_label.grid(row=0, column=0, sticky="w", pady=(0, 8))
         
-        name_entry = customtkinter.CTkEntry(form_frame, height=32, placeholder_text="Your Setup Name")
-        name_entry.grid(row=0, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+        self._mf_name_entry = customtkinter.CTkEntry(form_frame, height=32, placeholder_text="Your Setup Name")
+        self._mf_name_entry.grid(row=0, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
         
         # Monitor selection - using helper method
-        mon_label = customtkinter.CTkLabel(form_frame, text="Monitor:", font=("Arial", 11))
+        mon_label = customtkinter.CTkLabel(form_frame, text="Monitor:", font=FONT_SMALL)
         mon_label.grid(row=1, column=0, sticky="w", pady=(0, 8))
         
         mon_choices = self._get_monitor_choices()
         
-        mon_var = customtkinter.StringVar(value=mon_choices[0])
-        mon_menu = customtkinter.CTkOptionMenu(form_frame, variable=mon_var, values=mon_choices, height=32)
-        mon_menu.grid(row=1, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+        self._mf_mon_var = customtkinter.StringVar(value=mon_choices[0])
+        self._mf_mon_menu = customtkinter.CTkOptionMenu(form_frame, variable=self._mf_mon_var, values=mon_choices, height=32)
+        self._mf_mon_menu.grid(row=1, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
         
         # Input selection - using helper method
-        input_label = customtkinter.CTkLabel(form_frame, text="Input:", font=("Arial", 11))
+        input_label = customtkinter.CTkLabel(form_frame, text="Input:", font=FONT_SMALL)
         input_label.grid(row=2, column=0, sticky="w", pady=(0, 8))
         
         initial_monitor_id = self._parse_monitor_selection(mon_choices[0])
-        initial_inputs = self._get_inputs_for_monitor(initial_monitor_id) or ["HDMI1", "DP1"]
-        input_var = customtkinter.StringVar(value=initial_inputs[0] if initial_inputs else "HDMI1")
-        input_menu = customtkinter.CTkOptionMenu(form_frame, variable=input_var, values=initial_inputs, height=32)
-        input_menu.grid(row=2, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+        initial_inputs = self._get_inputs_for_monitor(initial_monitor_id) or FALLBACK_INPUT_NAMES
+        self._mf_input_var = customtkinter.StringVar(value=initial_inputs[0] if initial_inputs else "HDMI1")
+        self._mf_input_menu = customtkinter.CTkOptionMenu(form_frame, variable=self._mf_input_var, values=initial_inputs, height=32)
+        self._mf_input_menu.grid(row=2, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
         
         form_frame.grid_columnconfigure(1, weight=1)
         
-        def update_input_options(*args):
-            sel_id = self._parse_monitor_selection(mon_var.get())
-            inputs_for_sel = self._get_inputs_for_monitor(sel_id) or ["DP1", "HDMI1", "DP2", "HDMI2"]
-            input_menu.configure(values=inputs_for_sel)
-            input_var.set(inputs_for_sel[0])
+        self._mf_mon_var.trace_add('write', self._mf_update_input_options)
+        
+        # Favorites list rows, recycled by _mf_update_list()
+        self._mf_row_pool = []
+        self._mf_empty_label = None
+        self._mf_list_fp = None          # (favorites, monitor choices) last rendered
+        self._mf_required_height = None  # Dialog height computed for that render
+        
+        add_btn = customtkinter.CTkButton(form_frame, text="➕ Add Favorite", command=self._mf_add, height=36, font=FONT_BOLD, **SUCCESS_BUTTON_STYLE)
+        add_btn.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        
+        self._mf_update_list()
+
+    def _mf_build_row(self, item):
+        """Build a favorites list row for item = (name, label text)."""
+        fav_name, label_text = item
+        fav_frame = customtkinter.CTkFrame(self._mf_list_frame)
+        
+        label = customtkinter.CTkLabel(fav_frame, text=label_text, font=FONT_SMALL)
+        label.pack(side="left", padx=8, pady=6)
+
+        # Delete button (red)
+        delete_btn = customtkinter.CTkButton(
+            fav_frame, text="Delete", width=70, height=28,
+            command=functools.partial(self._mf_delete, fav_name),
+            **DANGER_BUTTON_STYLE
+        )
+        delete_btn.pack(side="right", padx=8)
+
+        # Edit button (blue)
+        edit_btn = customtkinter.CTkButton(
+            fav_frame, text="Edit", width=70, height=28,
+            command=functools.partial(self._mf_edit, fav_name),
+            **EDIT_BUTTON_STYLE
+        )
+        edit_btn.pack(side="right", padx=8)
+        
+        return {'name': fav_name, 'frame': fav_frame, 'label': label,
+                'edit_btn': edit_btn, 'delete_btn': delete_btn}
+
+    def _mf_update_row(self, row, item):
+        """Point a pooled favorites row at item = (name, label text)."""
+        fav_name, label_text = item
+        if row['label'].cget("text") != label_text:
+            row['label'].configure(text=label_text)
+        if row['name'] != fav_name:
+            row['name'] = fav_name
+            row['delete_btn'].configure(command=functools.partial(self._mf_delete, fav_name))
+            row['edit_btn'].configure(command=functools.partial(self._mf_edit, fav_name))
+
+    def _mf_reload(self):
+        """Refresh monitor choices and the favorites list when the dialog is re-shown."""
+        choices = self._get_monitor_choices()
+        self._mf_mon_menu.configure(values=choices)
+        self._mf_mon_var.set(choices[0])  # Trace updates the input options
+        self._mf_name_entry.delete(0, 'end')
+        self._mf_update_list()
+
+    def _mf_update_list(self):
+        """
+        Refresh the favorites list display in the manage favorites dialog.
+        
+        Row widgets are kept in self._mf_row_pool and synced through
+        _sync_row_pool() (see _mf_build_row/_mf_update_row). The pool is
+        dropped with the dialog when the display scaling changes.
+        """
+        # Nothing to redo when neither the favorites nor the detected
+        # monitors changed since the last refresh (e.g. a plain reopen)
+        fingerprint = (tuple(self.favorites.items()), tuple(self._mon_choice_strings))
+        if fingerprint == self._mf_list_fp:
+            self.manage_window.geometry(f"480x{self._mf_required_height}")
+            return
+        self._mf_list_fp = fingerprint
         
-        mon_var.trace_add('write', update_input_options)
+        favorites_list_frame = self._mf_list_frame
+        pool = self._mf_row_pool
         
-        def add_fav():
-            name = name_entry.get().strip()
+        if not self.favorites:
+            for row in pool:
+                row['frame'].pack_forget()
+            # Show placeholder when no favorites exist
+            if self._mf_empty_label is None:
+                self._mf_empty_label = customtkinter.CTkLabel(favorites_list_frame, text="No favorites saved yet.", text_color="gray")
+            self._mf_empty_label.pack(pady=20)
+            favorites_list_frame.configure(height=60)
+        else:
+            if self._mf_empty_label is not None:
+                self._mf_empty_label.pack_forget()
+            
+            # Calculate height based on number of favorites (each item ~45px)
+            num_favorites = len(self.favorites)
+            new_height = min(60 + (num_favorites * 45), 250)  # Cap at 250px
+            favorites_list_frame.configure(height=new_height)
+            
+            mon_by_id = self._monitors_by_id
             
-            # FIX #7: Use validation helper method
-            is_valid, error_msg = self._validate_favorite_name(name)
-            if not is_valid:
-                messagebox.showerror("Validation Error", error_msg, parent=manage_window)
+            # Label showing: FavoriteName: MonitorName → InputSource
+            items = []
+            for fav_name, (monitor_id, input_source) in self.favorites.items():
+                # Get monitor display name
                 try:
-                    name_entry.focus_set()
-                    name_entry.select_range(0, 'end')
+                    mon = mon_by_id.get(monitor_id)
+                    display_name = mon.get('display_name', f"Monitor {monitor_id}") if mon else f"Monitor {monitor_id}"
                 except Exception:
-                    pass
-                return
-            
-            monitor_id = self._parse_monitor_selection(mon_var.get())
-            input_source = input_var.get()
+                    display_name = f"Monitor {monitor_id}"
+                items.append((fav_name, f"{fav_name}: {display_name} → {input_source}"))
             
-            if self.add_favorite(name, monitor_id, input_source):
-                update_favorites_list()
+            self._sync_row_pool(pool, items, self._mf_build_row, self._mf_update_row)
+        
+        # Dynamically adjust window height based on content
+        manage_window = self.manage_window
+        manage_window.update_idletasks()
+        required_height = self._mf_main_frame.winfo_reqheight() + 30
+        manage_window.geometry(f"480x{required_height}")
+        self._mf_required_height = required_height
+
+    def _mf_delete(self, name):
+        """Delete a favorite after confirmation."""
+        manage_window = self.manage_window
+        try:
+            try:
+                confirm = messagebox.askyesno("Confirm Delete", f"Delete favorite '{name}'?", parent=manage_window)
+            except Exception:
+                confirm = True
+
+            if not confirm:
+                return
+
+            if self.remove_favorite(name):
+                self._mf_update_list()
                 self.refresh_favorites_buttons()
-                name_entry.delete(0, 'end')
-                messagebox.showinfo("Success", f"Favorite '{name}' added!", parent=manage_window)
+                try:
+                    messagebox.showinfo("Success", f"Favorite '{name}' removed!", parent=manage_window)
+                except Exception:
+                    pass
             else:
-                messagebox.showerror("Error", "Failed to add favorite", parent=manage_window)
+                try:
+                    messagebox.showerror("Error", f"Failed to remove favorite '{name}'", parent=manage_window)
+                except Exception:
+                    pass
+        except Exception as e:
+            logging.error(f"Failed to remove favorite {name}: {e}")
+
+    def _mf_edit(self, name):
+        """
+        Open an edit dialog to modify a favorite's name, monitor, or input.
         
-        add_btn = customtkinter.CTkButton(form_frame, text="➕ Add Favorite", command=add_fav, height=36, font=("Arial", 12, "bold"), fg_color="#28a745", hover_color="#218838")
-        add_btn.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        Uses helper methods to reduce code duplication with the add favorite form.
+        """
+        manage_window = self.manage_window
+        current = self.favorites.get(name)
+        if not current:
+            messagebox.showerror("Error", f"Favorite '{name}' not found", parent=manage_window)
+            return
+
+        try:
+            monitor_id, input_source = current
+        except Exception:
+            monitor_id, input_source = 0, "HDMI1"
+
+        # Create edit dialog
+        edit_win = customtkinter.CTkToplevel(manage_window)
+        edit_win.title(f"Edit Favorite - {name}")
+        edit_win.transient(manage_window)
+        edit_win.grab_set()
+        edit_win.resizable(False, False)
+        self._center_dialog_on_parent(edit_win, manage_window, 350, 220)
+
+        frm = customtkinter.CTkFrame(edit_win)
+        frm.pack(fill="both", expand=True, padx=12, pady=12)
+
+        # Name
+        name_label2 = customtkinter.CTkLabel(frm, text="Name:", font=FONT_SMALL)
+        name_label2.grid(row=0, column=0, sticky="w", pady=(0, 8))
+        name_var2 = customtkinter.StringVar(value=name)
+        
+        # Limit name entry to 20 characters
+        name_var2.trace_add('write', functools.partial(self._mf_limit_name_length, name_var2))
         
-        update_favorites_list()
+        name_entry2 = customtkinter.CTkEntry(frm, textvariable=name_var2, height=32)
+        name_entry2.grid(row=0, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+
+        # Monitor - using helper method
+        mon_label2 = customtkinter.CTkLabel(frm, text="Monitor:", font=FONT_SMALL)
+        mon_label2.grid(row=1, column=0, sticky="w", pady=(0, 8))
+
+        mon_choices = self._get_monitor_choices()
+        default_mon_str = self._mon_choice_by_id.get(monitor_id, mon_choices[0])
+
+        mon_var2 = customtkinter.StringVar(value=default_mon_str)
+        mon_menu2 = customtkinter.CTkOptionMenu(frm, variable=mon_var2, values=mon_choices, height=32)
+        mon_menu2.grid(row=1, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+
+        # Input - using helper method
+        input_label2 = customtkinter.CTkLabel(frm, text="Input:", font=FONT_SMALL)
+        input_label2.grid(row=2, column=0, sticky="w", pady=(0, 8))
+
+        sel_id_init = self._parse_monitor_selection(default_mon_str)
+        inputs_list2 = self._get_inputs_for_monitor(sel_id_init) or FALLBACK_INPUT_NAMES
+        input_var2 = customtkinter.StringVar(value=input_source if input_source in inputs_list2 else (inputs_list2[0] if inputs_list2 else "HDMI1"))
+        input_menu2 = customtkinter.CTkOptionMenu(frm, variable=input_var2, values=inputs_list2, height=32)
+        input_menu2.grid(row=2, column=1, sticky="ew", pady=(0, 8), padx=(10, 0))
+
+        frm.grid_columnconfigure(1, weight=1)
+
+        mon_var2.trace_add('write', functools.partial(self._mf_edit_update_inputs, mon_var2, input_menu2, input_var2))
+
+        btn_frame = customtkinter.CTkFrame(frm, fg_color='transparent')
+        btn_frame.grid(row=3, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+
+        save_edit = functools.partial(self._mf_save_edit, name, edit_win, name_var2, name_entry2, mon_var2, input_var2)
+        save_btn = customtkinter.CTkButton(btn_frame, text="💾 Save", command=save_edit, height=36, width=100, **SUCCESS_BUTTON_STYLE)
+        save_btn.pack(side="right", padx=(0, 6))
+
+        cancel_btn = customtkinter.CTkButton(btn_frame, text="Cancel", command=edit_win.destroy, height=36, width=100, **CANCEL_BUTTON_STYLE)
+        cancel_btn.pack(side="right", padx=(0, 6))
+
+        # Make the edit dialog a bit larger (but smaller than Manage Favorites)
+        edit_win.update_idletasks()
+        req_w = max(360, min(440, frm.winfo_reqwidth() + 60))
+        req_h = frm.winfo_reqheight() + 40
+        edit_win.geometry(f"{req_w}x{req_h}")
+
+    def _mf_limit_name_length(self, name_var, *args):
+        """Trace callback that trims a favorite name variable to 20 characters."""
+        value = name_var.get()
+        if len(value) > 20:
+            name_var.set(value[:20])
+
+    def _mf_edit_update_inputs(self, mon_var, input_menu, input_var, *args):
+        """Trace callback that updates the edit dialog's inputs for the selected monitor."""
+        sel_id = self._parse_monitor_selection(mon_var.get())
+        new_inputs = self._get_inputs_for_monitor(sel_id) or FALLBACK_INPUT_NAMES
+        try:
+            input_menu.configure(values=new_inputs)
+            input_var.set(new_inputs[0])
+        except Exception:
+            pass
+
+    def _mf_save_edit(self, name, edit_win, name_var, name_entry, mon_var, input_var):
+        """Validate and save the favorite being edited in edit_win."""
+        newname = name_var.get().strip()
+        
+        # FIX #7: Use validation helper method
+        is_valid, error_msg = self._validate_favorite_name(newname, exclude_name=name)
+        if not is_valid:
+            messagebox.showerror("Validation Error", error_msg, parent=edit_win)
+            try:
+                name_entry.focus_set()
+                name_entry.select_range(0, 'end')
+            except Exception:
+                pass
+            return
+
+        monitor_id_new = self._parse_monitor_selection(mon_var.get())
+        input_new = input_var.get()
+
+        try:
+            if newname != name and name in self.favorites:
+                del self.favorites[name]
+                self._favorites_lower.pop(name.lower(), None)
+            self.favorites[newname] = Favorite(monitor_id_new, input_new)
+            self._favorites_lower[newname.lower()] = newname
+            self.save_favorites()
+            self._mf_update_list()
+            self.refresh_favorites_buttons()
+            messagebox.showinfo("Success", f"Favorite '{newname}' saved!", parent=edit_win)
+            edit_win.destroy()
+        except Exception as e:
+            logging.error(f"Failed to save edited favorite: {e}")
+            messagebox.showerror("Error", "Failed to save favorite", parent=edit_win)
+
+    def _mf_update_input_options(self, *args):
+        """
+        Trace callback that schedules an input list refresh for the add form.
+        
+        Rapid writes to the monitor variable within 50ms are coalesced so
+        the option menu is reconfigured only once, for the final selection.
+        """
+        if self._mf_input_update_job is not None:
+            self.after_cancel(self._mf_input_update_job)
+        self._mf_input_update_job = self.after(50, self._mf_apply_input_options)
+
+    def _mf_apply_input_options(self):
+        """Update the add form's inputs for the selected monitor."""
+        if self._mf_input_update_job is not None:
+            self.after_cancel(self._mf_input_update_job)  # No-op if it already fired
+            self._mf_input_update_job = None
+        input_menu = getattr(self, '_mf_input_menu', None)
+        try:
+            if input_menu is None or not input_menu.winfo_exists():
+                return  # Dialog torn down before the refresh ran
+        except Exception:
+            return
+        sel_id = self._parse_monitor_selection(self._mf_mon_var.get())
+        inputs_for_sel = self._get_inputs_for_monitor(sel_id) or FALLBACK_INPUT_NAMES
+        input_menu.configure(values=inputs_for_sel)
+        self._mf_input_var.set(inputs_for_sel[0])
+
+    def _mf_add(self):
+        """Validate the add form and save it as a new favorite."""
+        manage_window = self.manage_window
+        name_entry = self._mf_name_entry
+        name = name_entry.get().strip()
+        
+        # Apply a still-pending input refresh so the input matches the monitor
+        if self._mf_input_update_job is not None:
+            self._mf_apply_input_options()
+        
+        # FIX #7: Use validation helper method
+        is_valid, error_msg = self._validate_favorite_name(name)
+        if not is_valid:
+            messagebox.showerror("Validation Error", error_msg, parent=manage_window)
+            try:
+                name_entry.focus_set()
+                name_entry.select_range(0, 'end')
+            except Exception:
+                pass
+            return
+        
+        monitor_id = self._parse_monitor_selection(self._mf_mon_var.get())
+        input_source = self._mf_input_var.get()
+        
+        if self.add_favorite(name, monitor_id, input_source):
+            self._mf_update_list()
+            self.refresh_favorites_buttons()
+            name_entry.delete(0, 'end')
+            messagebox.showinfo("Success", f"Favorite '{name}' added!", parent=manage_window)
+        else:
+            messagebox.showerror("Error", "Failed to add favorite", parent=manage_window)
 
     # ==========================================================================
     # SHORTCUTS EDITOR DIALOG
@@ -3048,7 +3565,6 @@ class App(customtkinter.CTk):
         editor_window.transient(self)  # Make dialog modal
         editor_window.grab_set()       # Block interaction with parent
         self._center_dialog_on_parent(editor_window, self, 520, 600)
-        editor_window.bind('<Destroy>', lambda e: setattr(self, 'editor_window', None))
         
         main_frame = customtkinter.CTkFrame(editor_window)
         main_frame.pack(fill="both", expand=True, padx=15, pady=15)
@@ -3097,66 +3613,97 @@ class App(customtkinter.CTk):
         shortcuts_frame = customtkinter.CTkScrollableFrame(shortcuts_section, height=320)
         shortcuts_frame.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         
+        # Row widgets are recycled across list refreshes instead of being
+        # destroyed and rebuilt; surplus rows are hidden with pack_forget()
+        # Each entry: {'shortcut', 'frame', 'label', 'edit_btn', 'delete_btn'}
+        row_pool = []
+        # Use list to allow modification in nested function
+        notice_label = [None]
+        # (shortcuts, monitor choices) last rendered, to skip no-op refreshes
+        list_fp = [None]
+        
         def update_shortcuts_list():
-            """Rebuild the shortcuts list display."""
-            # Clear existing items
-            for widget in shortcuts_frame.winfo_children():
-                widget.destroy()
-                
-            monitors_list = self.monitors_data if hasattr(self, 'monitors_data') and self.monitors_data else []
-            shown = 0
+            """Refresh the shortcuts list display, reusing pooled row widgets."""
+            fingerprint = (tuple(self.shortcuts.items()), tuple(self._mon_choice_strings))
+            if fingerprint == list_fp[0]:
+                return  # Nothing that is displayed has changed
+            list_fp[0] = fingerprint
+            
+            # Bind module attributes once for the row callbacks below
+            monitors_by_id = self._monitors_by_id
+            ctk_frame = customtkinter.CTkFrame
+            ctk_label = customtkinter.CTkLabel
+            ctk_button = customtkinter.CTkButton
+            partial = functools.partial
             
-            # Display each shortcut as a row
+            # Only show shortcuts for currently connected monitors
+            # Display: "ctrl+alt+1: Samsung - C27G2 → HDMI1"
+            items = []
             for shortcut, (monitor_id, input_source) in self.shortcuts.items():
-                # Only show shortcuts for currently connected monitors
-                mon = next((m for m in monitors_list if m.get('id') == monitor_id), None)
-                if not mon:
-                    continue
-
-                shown += 1
-                shortcut_frame = customtkinter.CTkFrame(shortcuts_frame)
-                shortcut_frame.pack(fill="x", pady=3)
-
-                # Display: "ctrl+alt+1: Samsung - C27G2 → HDMI1"
-                display_name = mon.get('display_name', f"Monitor {monitor_id}")
-                label = customtkinter.CTkLabel(
+                mon = monitors_by_id.get(monitor_id)
+                if mon:
+                    display_name = mon.get('display_name', f"Monitor {monitor_id}")
+                    items.append((shortcut, f"{shortcut}: {display_name} → {input_source}"))
+            
+            def build_row(item):
+                shortcut, text = item
+                shortcut_frame = ctk_frame(shortcuts_frame)
+
+                label = ctk_label(
                     shortcut_frame,
-                    text=f"{shortcut}: {display_name} → {input_source}",
+                    text=text,
                     font=("Arial", 12),
                     wraplength=420
                 )
                 label.pack(side="left", padx=8, pady=6) 
 
                 # Edit/Delete buttons on the right
-                btn_frame = customtkinter.CTkFrame(shortcut_frame, fg_color="transparent")
+                btn_frame = ctk_frame(shortcut_frame, fg_color="transparent")
                 btn_frame.pack(side="right", padx=8)
 
-                edit_btn = customtkinter.CTkButton(
+                edit_btn = ctk_button(
                     btn_frame,
                     text="Edit",
                     width=70,
                     height=32,
-                    font=("Arial", 11),
-                    command=lambda s=shortcut: edit_shortcut(s)
+                    font=FONT_SMALL,
+                    command=partial(edit_shortcut, shortcut)
                 )
                 edit_btn.pack(side="left", padx=4)
 
-                delete_btn = customtkinter.CTkButton(
+                delete_btn = ctk_button(
                     btn_frame,
                     text="Delete",
                     width=70,
                     height=32,
-                    font=("Arial", 11),
-                    command=lambda s=shortcut: delete_shortcut(s),
-                    fg_color=("#D32F2F", "#C62828"),
-                    hover_color=("#C62828", "#B71C1C")
+                    font=FONT_SMALL,
+                    command=partial(delete_shortcut, shortcut),
+                    **DANGER_BUTTON_STYLE
                 )
                 delete_btn.pack(side="left", padx=4)
 
+                return {'shortcut': shortcut, 'frame': shortcut_frame, 'label': label,
+                        'edit_btn': edit_btn, 'delete_btn': delete_btn}
+            
+            def update_row(row, item):
+                shortcut, text = item
+                if row['label'].cget("text") != text:
+                    row['label'].configure(text=text)
+                if row['shortcut'] != shortcut:
+                    row['shortcut'] = shortcut
+                    row['edit_btn'].configure(command=partial(edit_shortcut, shortcut))
+                    row['delete_btn'].configure(command=partial(delete_shortcut, shortcut))
+            
+            self._sync_row_pool(row_pool, items, build_row, update_row)
+            shown = len(items)
+
             # Show notice if no shortcuts are configured for connected monitors
             if shown == 0:
-                notice = customtkinter.CTkLabel(shortcuts_frame, text="No shortcuts for currently connected monitors.", text_color="gray")
-                notice.pack(pady=20)
+                if notice_label[0] is None:
+                    notice_label[0] = ctk_label(shortcuts_frame, text="No shortcuts for currently connected monitors.", text_color="gray")
+                notice_label[0].pack(pady=20)
+            elif notice_label[0] is not None:
+                notice_label[0].pack_forget()
 
         def record_shortcut(callback):
             """
@@ -3187,12 +3734,11 @@ class App(customtkinter.CTk):
             # Use list to allow modification in nested function
             hook_handle = [None]
             
-            # Map of shifted characters to their base number keys
-            # e.g., Shift+2 produces '@', but we want to record as 'shift+2'
-            char_to_key = {
-                '@': '2', '!': '1', '#': '3', '$': '4', '%': '5',
-                '^': '6', '&': '7', '*': '8', '(': '9', ')': '0'
-            }
+            # Bound once here so the per-keystroke handler avoids repeated
+            # attribute lookups and list construction
+            modifier_keys = ('ctrl', 'alt', 'shift')
+            is_pressed = keyboard.is_pressed
+            char_to_key_get = SHIFTED_CHAR_TO_KEY.get
             
             def cleanup_hook():
                 """Remove the keyboard hook to prevent memory leaks."""
@@ -3206,24 +3752,25 @@ class App(customtkinter.CTk):
             def on_key(event):
                 """Handle key press event during recording."""
                 # Skip if this is just a modifier key press
-                if event.name not in recorded_keys and event.name not in ['ctrl', 'alt', 'shift']:
+                name = event.name
+                if name not in recorded_keys and name not in modifier_keys:
                     # Add pressed modifiers first
-                    recorded_keys.extend(k for k in ['ctrl', 'alt', 'shift'] if keyboard.is_pressed(k))
+                    recorded_keys.extend(k for k in modifier_keys if is_pressed(k))
                     
                     # Map shifted characters back to their base keys
-                    key_name = char_to_key.get(event.name, event.name)
+                    key_name = char_to_key_get(name, name)
                     recorded_keys.append(key_name)
                     
                     shortcut = '+'.join(recorded_keys)
                     label.configure(text=f"Recorded: {shortcut}\n\nPress ENTER to confirm or ESC to cancel")
                     
                     # Handle confirmation or cancellation
-                    if event.name == 'enter':
+                    if name == 'enter':
                         cleanup_hook()
                         dialog.destroy()
                         # Pass shortcut without the final 'enter' key
                         callback('+'.join(recorded_keys[:-1]))
-                    elif event.name == 'esc':
+                    elif name == 'esc':
                         cleanup_hook()
                         dialog.destroy()
             
@@ -3233,6 +3780,14 @@ class App(customtkinter.CTk):
             # FIX #3: Also cleanup if user closes dialog via window X button
             dialog.protocol("WM_DELETE_WINDOW", lambda: (cleanup_hook(), dialog.destroy()))
             
+            # Also cleanup if the dialog is destroyed any other way (e.g. the
+            # shortcuts editor closing underneath it), so hooks never pile up
+            def on_dialog_destroy(event):
+                # <Destroy> also fires for child widgets; react to the dialog only
+                if event.widget is dialog:
+                    cleanup_hook()
+            dialog.bind('<Destroy>', on_dialog_destroy, add='+')
+            
         def add_new_shortcut():
             """Start the process of adding a new shortcut."""
             def on_shortcut(shortcut):
@@ -3252,31 +3807,40 @@ class App(customtkinter.CTk):
                     title = customtkinter.CTkLabel(frame, text=f"Shortcut: {shortcut}", font=("Arial", 13, "bold"))
                     title.pack(pady=(0, 15))
 
-                    # Build monitor choices list
-                    monitors_list = self.monitors_data if hasattr(self, 'monitors_data') and self.monitors_data else []
-                    mon_choices = [f"{m.get('id')}: {m.get('display_name')}" for m in monitors_list] if monitors_list else ["0"]
+                    # Monitor choices and per-monitor inputs are precomputed
+                    # once per detection by _index_monitors_data()
+                    mon_choices = self._get_monitor_choices()
 
-                    mon_label = customtkinter.CTkLabel(frame, text="Select Monitor:", font=("Arial", 11))
+                    mon_label = customtkinter.CTkLabel(frame, text="Select Monitor:", font=FONT_SMALL)
                     mon_label.pack(anchor="w", pady=(0, 5))
 
                     mon_var = customtkinter.StringVar(value=mon_choices[0])
                     mon_menu = customtkinter.CTkOptionMenu(frame, variable=mon_var, values=mon_choices, height=32)
                     mon_menu.pack(fill="x", pady=(0, 15))
 
-                    input_label = customtkinter.CTkLabel(frame, text="Select Input:", font=("Arial", 11))
+                    input_label = customtkinter.CTkLabel(frame, text="Select Input:", font=FONT_SMALL)
                     input_label.pack(anchor="w", pady=(0, 5))
 
                     # Get initial inputs for first monitor
-                    initial_inputs = monitors_list[0].get('inputs', []) if monitors_list else ["HDMI1", "DP1"]
+                    initial_inputs = self._get_inputs_for_monitor(self._parse_monitor_selection(mon_choices[0])) or FALLBACK_INPUT_NAMES
                     input_var = customtkinter.StringVar(value=initial_inputs[0] if initial_inputs else "HDMI1")
                     input_menu = customtkinter.CTkOptionMenu(frame, variable=input_var, values=initial_inputs, height=32)
                     input_menu.pack(fill="x", pady=(0, 20))
 
+                    # Pending after() id for the debounced input refresh
+                    # Use list to allow modification in nested function
+                    update_job = [None]
+
                     def save():
                         """Save the new shortcut configuration."""
+                        # Apply a still-pending input refresh so the input matches the monitor
+                        if update_job[0] is not None:
+                            update_input_options()
                         try:
                             sel = mon_var.get()
-                            monitor_id = int(sel.split(':', 1)[0].strip()) if ':' in sel else int(sel)
+                            monitor_id = self._mon_id_by_choice.get(sel)
+                            if monitor_id is None:
+                                monitor_id = int(sel.split(':', 1)[0].strip())  # Not from the current detection
                             input_source = input_var.get()
                             
                             if self.add_shortcut(shortcut, monitor_id, input_source):
@@ -3291,32 +3855,36 @@ class App(customtkinter.CTk):
                         except ValueError:
                             messagebox.showerror("Error", "Invalid monitor selection", parent=select_dialog)
 
-                    save_btn = customtkinter.CTkButton(frame, text="Save Shortcut", command=save, height=36, font=("Arial", 12, "bold"), fg_color="#28a745", hover_color="#218838")
+                    save_btn = customtkinter.CTkButton(frame, text="Save Shortcut", command=save, height=36, font=FONT_BOLD, **SUCCESS_BUTTON_STYLE)
                     save_btn.pack(fill="x")
 
-                    def update_input_options(*args):
+                    def update_input_options():
                         """Update input choices when monitor selection changes."""
-                        sel = mon_var.get()
-                        try:
-                            sel_id = int(sel.split(':', 1)[0].strip()) if ':' in sel else int(sel)
-                        except Exception:
-                            return
+                        if update_job[0] is not None:
+                            self.after_cancel(update_job[0])  # No-op if it already fired
+                            update_job[0] = None
+                        sel_id = self._parse_monitor_selection(mon_var.get())
                         
                         # Find inputs for selected monitor
-                        inputs_for_sel = []
-                        for mon in monitors_list:
-                            if mon.get('id') == sel_id:
-                                inputs_for_sel = mon.get('inputs', []) or []
-                                break
+                        inputs_for_sel = self._get_inputs_for_monitor(sel_id)
                         
                         # Fallback to common inputs if none detected
                         if not inputs_for_sel:
-                            inputs_for_sel = ["DP1", "HDMI1", "DP2", "HDMI2"]
+                            inputs_for_sel = FALLBACK_INPUT_NAMES
                         
-                        input_menu.configure(values=inputs_for_sel)
-                        input_var.set(inputs_for_sel[0])
+                        try:
+                            input_menu.configure(values=inputs_for_sel)
+                            input_var.set(inputs_for_sel[0])
+                        except Exception:
+                            pass  # Dialog closed before the refresh ran
+
+                    def schedule_input_update(*args):
+                        """Coalesce rapid monitor changes into one input refresh after 50ms."""
+                        if update_job[0] is not None:
+                            self.after_cancel(update_job[0])
+                        update_job[0] = self.after(50, update_input_options)
 
-                    mon_var.trace_add('write', update_input_options)
+                    mon_var.trace_add('write', schedule_input_update)
                     update_input_options()
             
             # Start by recording the shortcut
@@ -3346,7 +3914,7 @@ class App(customtkinter.CTk):
             
             # Current shortcut display with change button
             shortcut_var = customtkinter.StringVar(value=shortcut)
-            shortcut_label = customtkinter.CTkLabel(frame, text="Shortcut Key:", font=("Arial", 11))
+            shortcut_label = customtkinter.CTkLabel(frame, text="Shortcut Key:", font=FONT_SMALL)
             shortcut_label.pack(anchor="w", pady=(0, 5))
             
             shortcut_frame = customtkinter.CTkFrame(frame, fg_color="transparent")
@@ -3366,17 +3934,12 @@ class App(customtkinter.CTk):
             change_key_btn.pack(side="left")
             
             # Monitor selection
-            monitors_list = self.monitors_data if hasattr(self, 'monitors_data') and self.monitors_data else []
-            mon_choices = [f"{m.get('id')}: {m.get('display_name')}" for m in monitors_list] if monitors_list else ["0"]
+            mon_choices = self._get_monitor_choices()
             
             # Find the current monitor choice to pre-select
-            current_mon_choice = mon_choices[0]
-            for choice in mon_choices:
-                if choice.startswith(f"{current_monitor_id}:"):
-                    current_mon_choice = choice
-                    break
+            current_mon_choice = self._mon_choice_by_id.get(current_monitor_id, mon_choices[0])
             
-            mon_label = customtkinter.CTkLabel(frame, text="Select Monitor:", font=("Arial", 11))
+            mon_label = customtkinter.CTkLabel(frame, text="Select Monitor:", font=FONT_SMALL)
             mon_label.pack(anchor="w", pady=(0, 5))
             
             mon_var = customtkinter.StringVar(value=current_mon_choice)
@@ -3384,17 +3947,13 @@ class App(customtkinter.CTk):
             mon_menu.pack(fill="x", pady=(0, 15))
             
             # Input selection
-            input_label = customtkinter.CTkLabel(frame, text="Select Input:", font=("Arial", 11))
+            input_label = customtkinter.CTkLabel(frame, text="Select Input:", font=FONT_SMALL)
             input_label.pack(anchor="w", pady=(0, 5))
             
             # Get inputs for current monitor
-            initial_inputs = []
-            for mon in monitors_list:
-                if mon.get('id') == current_monitor_id:
-                    initial_inputs = mon.get('inputs', [])
-                    break
+            initial_inputs = self._get_inputs_for_monitor(current_monitor_id)
             if not initial_inputs:
-                initial_inputs = ["DP1", "HDMI1", "DP2", "HDMI2"]
+                initial_inputs = FALLBACK_INPUT_NAMES
             
             input_var = customtkinter.StringVar(value=current_input if current_input in initial_inputs else initial_inputs[0])
             input_menu = customtkinter.CTkOptionMenu(frame, variable=input_var, values=initial_inputs, height=32)
@@ -3402,20 +3961,12 @@ class App(customtkinter.CTk):
             
             def update_input_options(*args):
                 """Update input choices when monitor selection changes."""
-                sel = mon_var.get()
-                try:
-                    sel_id = int(sel.split(':', 1)[0].strip()) if ':' in sel else int(sel)
-                except Exception:
-                    return
+                sel_id = self._parse_monitor_selection(mon_var.get())
                 
-                inputs_for_sel = []
-                for mon in monitors_list:
-                    if mon.get('id') == sel_id:
-                        inputs_for_sel = mon.get('inputs', []) or []
-                        break
+                inputs_for_sel = self._get_inputs_for_monitor(sel_id)
                 
                 if not inputs_for_sel:
-                    inputs_for_sel = ["DP1", "HDMI1", "DP2", "HDMI2"]
+                    inputs_for_sel = FALLBACK_INPUT_NAMES
                 
                 input_menu.configure(values=inputs_for_sel)
                 # Keep current input if it exists in new list, otherwise use first
@@ -3429,23 +3980,26 @@ class App(customtkinter.CTk):
                 try:
                     new_shortcut = shortcut_var.get()
                     sel = mon_var.get()
-                    monitor_id = int(sel.split(':', 1)[0].strip()) if ':' in sel else int(sel)
+                    monitor_id = self._mon_id_by_choice.get(sel)
+                    if monitor_id is None:
+                        monitor_id = int(sel.split(':', 1)[0].strip())  # Not from the current detection
                     input_source = input_var.get()
                     
                     # Remove old shortcut if key changed
                     if new_shortcut != shortcut:
                         self.shortcuts.pop(shortcut, None)
+                        self._unregister_hotkey(shortcut)
                     
                     # Save new/updated shortcut
                     self.shortcuts[new_shortcut] = (monitor_id, input_source)
                     self.save_shortcuts()
                     
+                    # Re-bind only this shortcut; the others are untouched
                     try:
-                        keyboard.clear_all_hotkeys()
-                    except Exception:
-                        pass
+                        self._register_hotkey(new_shortcut, monitor_id, input_source)
+                    except Exception as e:
+                        logging.error(f"Failed to register hotkey {new_shortcut}: {e}")
                     
-                    self.setup_global_hotkeys()
                     update_shortcuts_list()
                     
                     try:
@@ -3456,7 +4010,7 @@ class App(customtkinter.CTk):
                 except ValueError:
                     messagebox.showerror("Error", "Invalid monitor selection", parent=edit_dialog)
             
-            save_btn = customtkinter.CTkButton(frame, text="Save Changes", command=save, height=36, font=("Arial", 12, "bold"), fg_color="#28a745", hover_color="#218838")
+            save_btn = customtkinter.CTkButton(frame, text="Save Changes", command=save, height=36, font=FONT_BOLD, **SUCCESS_BUTTON_STYLE)
             save_btn.pack(fill="x")
 
             
@@ -3465,7 +4019,7 @@ class App(customtkinter.CTk):
             Delete a shortcut after user confirmation.
             
             Removes the shortcut from the dictionary, saves to disk,
-            and re-registers all remaining hotkeys.
+            and unregisters just that hotkey.
             
             Args:
                 shortcut: The shortcut key string to delete
@@ -3483,12 +4037,8 @@ class App(customtkinter.CTk):
                 self.shortcuts.pop(shortcut)
                 self.save_shortcuts()
                 
-                # Re-register all remaining hotkeys
-                try:
-                    keyboard.clear_all_hotkeys()
-                except Exception:
-                    pass
-                self.setup_global_hotkeys()
+                # Unregister only the deleted hotkey
+                self._unregister_hotkey(shortcut)
                 update_shortcuts_list()
                 
                 try:
@@ -3505,7 +4055,7 @@ class App(customtkinter.CTk):
         buttons_frame = customtkinter.CTkFrame(main_frame, fg_color="transparent")
         buttons_frame.pack(fill="x")
         
-        add_button = customtkinter.CTkButton(buttons_frame, text="➕ Add New Shortcut", command=add_new_shortcut, height=36, font=("Arial", 12, "bold"), fg_color="#28a745", hover_color="#218838")
+        add_button = customtkinter.CTkButton(buttons_frame, text="➕ Add New Shortcut", command=add_new_shortcut, height=36, font=FONT_BOLD, **SUCCESS_BUTTON_STYLE)
         add_button.pack(fill="x")
         
         # Initial population of the shortcuts list
@@ -3536,10 +4086,14 @@ class App(customtkinter.CTk):
         title = customtkinter.CTkLabel(frame, text="⌨️ Available Shortcuts", font=("Arial", 16, "bold"))
         title.pack(pady=(0, 15))
         
-        # Display each registered shortcut
-        for shortcut, (monitor_id, input_source) in self.shortcuts.items():
-            text = f"{shortcut}: Switch Monitor {monitor_id} to {input_source}"
-            label = customtkinter.CTkLabel(frame, text=text, font=("Arial", 11))
+        # Display all registered shortcuts in one multi-line label rather
+        # than one widget per shortcut
+        lines = [
+            f"{shortcut}: Switch Monitor {monitor_id} to {input_source}"
+            for shortcut, (monitor_id, input_source) in self.shortcuts.items()
+        ]
+        if lines:
+            label = customtkinter.CTkLabel(frame, text="\n".join(lines), font=FONT_SMALL, justify="left")
             label.pack(anchor="w", pady=3)
         
         # Show the built-in help shortcut
@@ -3552,7 +4106,7 @@ class App(customtkinter.CTk):
             text="Customize Shortcuts",
             command=lambda: [help_window.destroy(), self.show_shortcuts_editor()],
             height=36,
-            font=("Arial", 12, "bold")
+            font=FONT_BOLD
         )
         customize_btn.pack(pady=(20, 0), fill="x")
 
@@ -3563,6 +4117,548 @@ class App(customtkinter.CTk):
 # These functions operate independently of the App class and are used for
 # CLI mode operation and input code translation.
 
+# Win32 structures for mapping a monitor handle to its PnP instance path
+# (ctypes.wintypes imports on every platform; the DLL calls are Windows-only)
+EDD_GET_DEVICE_INTERFACE_NAME = 0x00000001
+
+
+class _MONITORINFOEXW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD),
+        ("szDevice", wintypes.WCHAR * 32),
+    ]
+
+
+class _DISPLAY_DEVICEW(ctypes.Structure):
+    _fields_ = [
+        ("cb", wintypes.DWORD),
+        ("DeviceName", wintypes.WCHAR * 32),
+        ("DeviceString", wintypes.WCHAR * 128),
+        ("StateFlags", wintypes.DWORD),
+        ("DeviceID", wintypes.WCHAR * 128),
+        ("DeviceKey", wintypes.WCHAR * 128),
+    ]
+
+
+# Declared prototypes so ctypes passes the HMONITOR as a pointer-sized
+# handle (the default int conversion truncates it on 64-bit Python).
+# A private WinDLL keeps these declarations off the shared ctypes.windll.
+if IS_WINDOWS:
+    _user32 = ctypes.WinDLL('user32')
+    _GetMonitorInfoW = _user32.GetMonitorInfoW
+    _GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(_MONITORINFOEXW)]
+    _GetMonitorInfoW.restype = wintypes.BOOL
+    _EnumDisplayDevicesW = _user32.EnumDisplayDevicesW
+    _EnumDisplayDevicesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD,
+                                     ctypes.POINTER(_DISPLAY_DEVICEW), wintypes.DWORD]
+    _EnumDisplayDevicesW.restype = wintypes.BOOL
+
+
+def _normalize_instance_id(device_id):
+    """
+    Reduce a monitor device ID to an upper-case PnP instance path.
+    
+    Accepts both the WMI form (DISPLAY\\GSM5B10\\5&ABC&0&UID123) and the
+    device interface form returned by EnumDisplayDevicesW
+    (\\\\?\\DISPLAY#GSM5B10#5&abc&0&UID123#{e6f07b5f-...}).
+    
+    Args:
+        device_id: Device ID string in either form
+    
+    Returns:
+        str: Normalized instance path, or None if device_id is empty
+    """
+    if not device_id:
+        return None
+    path = device_id.upper()
+    if path.startswith('\\\\?\\'):
+        # Drop the prefix and interface class GUID, then restore separators
+        path = path[4:].split('#{', 1)[0].replace('#', '\\')
+    return path
+
+
+def _monitor_instance_id(monitor_obj):
+    """
+    Get the PnP instance path of a monitorcontrol monitor (Windows only).
+    
+    Resolves the monitor's HMONITOR to its display device name, then asks
+    EnumDisplayDevicesW for the device interface path of the attached
+    monitor.
+    
+    Args:
+        monitor_obj: monitorcontrol Monitor object
+    
+    Returns:
+        str: Normalized instance path, or None if it can't be determined
+    """
+    if not IS_WINDOWS:
+        return None
+    hmonitor = getattr(getattr(monitor_obj, 'vcp', None), 'hmonitor', None)
+    if not hmonitor:
+        return None
+    try:
+        info = _MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(info)
+        if not _GetMonitorInfoW(hmonitor, ctypes.byref(info)):
+            return None
+        device = _DISPLAY_DEVICEW()
+        device.cb = ctypes.sizeof(device)
+        if not _EnumDisplayDevicesW(info.szDevice, 0, ctypes.byref(device),
+                                    EDD_GET_DEVICE_INTERFACE_NAME):
+            return None
+        return _normalize_instance_id(device.DeviceID)
+    except Exception as e:
+        # Visible in normal logs: a failure here silently degrades the
+        # PnP join to positional order
+        logging.warning(f"Could not get instance ID for monitor: {e}")
+        return None
+
+
+def _align_pnp_ids(monitors, pnp_ids):
+    """
+    Order WMI PnP Device IDs to match the monitorcontrol monitor list.
+    
+    WMI and DDC/CI enumerate displays independently, so the same position
+    in both lists isn't guaranteed to be the same monitor. Each monitor is
+    joined on its device instance path first; monitors left unmatched then
+    keep their positional ID if no other monitor claimed it, and finally
+    take any IDs still unassigned. No ID is ever given to two monitors.
+    
+    Args:
+        monitors: monitorcontrol Monitor objects from get_monitors()
+        pnp_ids: PnP Device IDs in WMI enumeration order
+    
+    Returns:
+        list: PnP Device ID (or None) for each monitor, indexed like monitors
+    """
+    by_instance = {_normalize_instance_id(pnp): pnp for pnp in pnp_ids if pnp}
+    aligned = [None] * len(monitors)
+    used = set()
+
+    # First pass: exact instance path matches
+    for i, monitor_obj in enumerate(monitors):
+        pnp = by_instance.get(_monitor_instance_id(monitor_obj))
+        if pnp is not None and pnp not in used:
+            aligned[i] = pnp
+            used.add(pnp)
+
+    # Second pass: unmatched monitors keep their positional ID if unused
+    for i in range(len(monitors)):
+        positional = pnp_ids[i] if i < len(pnp_ids) else None
+        if aligned[i] is None and positional and positional not in used:
+            aligned[i] = positional
+            used.add(positional)
+
+    # Third pass: hand out whatever IDs are still unused, in WMI order
+    remaining = [pnp for pnp in pnp_ids if pnp and pnp not in used]
+    for i in range(len(monitors)):
+        if aligned[i] is None and remaining:
+            aligned[i] = remaining.pop(0)
+    return aligned
+
+
+def _read_edid(pnp_id):
+    """
+    Read EDID (Extended Display Identification Data) from Windows registry.
+    
+    EDID is a standardized data structure that contains information about
+    the monitor including manufacturer, model, and supported resolutions.
+    
+    Args:
+        pnp_id: The PnP Device ID string from WMI
+    
+    Returns:
+        bytes: Raw EDID data or None if not found
+    """
+    try:
+        import winreg
+        # EDID is stored in the monitor's Device Parameters registry key
+        key = winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"SYSTEM\\CurrentControlSet\\Enum\\" + pnp_id + r"\Device Parameters"
+        )
+        edid_data, _ = winreg.QueryValueEx(key, "EDID")
+        return edid_data
+    except Exception:
+        return None
+
+
+def _parse_edid(edid):
+    """
+    Extract model name from EDID data.
+    
+    The model name is stored as ASCII text in bytes 54-72 of the EDID
+    (specifically in the descriptor blocks which start at byte 54).
+    
+    Args:
+        edid: Raw EDID bytes
+    
+    Returns:
+        str: Model name or "Unknown" if parsing fails
+    """
+    try:
+        # Extract printable ASCII characters from descriptor block
+        model = "".join(chr(c) for c in edid[54:72] if 32 <= c <= 126).strip()
+        return model if model else "Unknown"
+    except Exception:
+        return "Unknown"
+
+
+def _probe_monitor_identity(i, monitor_obj, pnp, pnp_u):
+    """
+    Read a monitor's display name and available inputs over DDC/CI.
+    
+    Args:
+        i: Monitor index (for log messages)
+        monitor_obj: monitorcontrol Monitor object to probe
+        pnp: PnP Device ID from WMI, or None
+        pnp_u: pnp uppercased, or None
+    
+    Returns:
+        tuple: (display_name, input_names, caps_ok, parsed_ok) where caps_ok
+               tells whether the VCP capabilities read succeeded and
+               parsed_ok whether the model and inputs were also parsed
+               from it without errors (only then is the result cacheable)
+    """
+    model = "Unknown"
+    brand = "Unknown"
+
+    # ------------------------------------------------------------------
+    # READ VCP CAPABILITIES (ONCE)
+    # ------------------------------------------------------------------
+    # The capabilities string is the slowest DDC/CI read, so it is fetched
+    # once and both the model name and the input list are taken from it
+    # caps_ok tracks whether the DDC/CI capabilities read succeeded
+    caps_ok = False
+    caps = {}
+    try:
+        with monitor_obj:
+            caps = monitor_obj.get_vcp_capabilities()
+            caps_ok = True
+    except Exception as e:
+        logging.warning(f"Could not get VCP capabilities for monitor {i}: {e}")
+
+    # ------------------------------------------------------------------
+    # GET MODEL NAME FROM VCP CAPABILITIES
+    # ------------------------------------------------------------------
+    if caps_ok:
+        model = caps.get('model', "Unknown")
+
+    # Fallback: Try to get model from EDID if VCP didn't provide it
+    if model == "Unknown" and IS_WINDOWS and pnp:
+        edid = _read_edid(pnp)
+        if edid:
+            model = _parse_edid(edid)
+
+    # ------------------------------------------------------------------
+    # DETERMINE BRAND NAME
+    # ------------------------------------------------------------------
+    if IS_WINDOWS:
+        # First try: Get brand from PNP manufacturer code (first 3 chars)
+        if brand == "Unknown" and pnp_u:
+            # PnP ID format: BUS\MANUFACTURER+PRODUCT\INSTANCE
+            # Slice the 3-letter manufacturer code after the first backslash
+            sep = pnp_u.find('\\')
+            if sep != -1:
+                brand = PNP_IDS.get(pnp_u[sep + 1:sep + 4], "Unknown")
+
+        # Fallback: Match model prefix to known brand patterns
+        if brand == "Unknown" and model != "Unknown":
+            match = MODEL_BRAND_RE.match(model.upper())
+            if match:
+                brand = MODEL_BRAND_MAP[match.group()]
+
+    # ------------------------------------------------------------------
+    # GET AVAILABLE INPUT SOURCES
+    # ------------------------------------------------------------------
+    input_names = []
+    inputs_ok = False
+    try:
+        for inp in caps.get('inputs', []):
+            if hasattr(inp, 'name'):
+                # Standard InputSource enum member
+                input_names.append(inp.name)
+            elif isinstance(inp, int):
+                # Raw integer code - map to known types or display as-is
+                # USB-C with DisplayPort Alt Mode uses code 27 (0x1B)
+                # Thunderbolt also uses USB-C connector with DP protocol
+                if inp == VCP_INPUT_USB_C:
+                    input_names.append("USB-C")
+                elif inp == VCP_INPUT_THUNDERBOLT:
+                    input_names.append("THUNDERBOLT")
+                else:
+                    # Unknown input code - display as is for debugging
+                    input_names.append(f"INPUT_{inp}")
+        inputs_ok = True
+    except Exception as e:
+        logging.warning(f"Could not get inputs for monitor {i}: {e}")
+
+    parsed_ok = caps_ok and inputs_ok and 'model' in caps
+    return f"{brand} - {model}", input_names, caps_ok, parsed_ok
+
+
+def _probe_monitor(i, monitor_obj, pnp_ids, cached=None):
+    """
+    Query one monitor over DDC/CI for its name, inputs and current input.
+    
+    Called from a worker thread per monitor by collect_monitor_data(), so
+    it only touches its own monitor object and the read-only pnp_ids list.
+    
+    Args:
+        i: Monitor index (position in the get_monitors() list)
+        monitor_obj: monitorcontrol Monitor object to probe
+        pnp_ids: PnP Device IDs from WMI, indexed like the monitors
+                 (empty on non-Windows systems)
+        cached: Optional monitor cache entry with 'display_name' and
+                'inputs'; when given, only the current input is read
+    
+    Returns:
+        tuple: (data, cacheable) - the monitor data dict (see
+               collect_monitor_data) and whether its name and inputs came
+               from a successful capabilities parse; None if the monitor
+               is an internal laptop display that should be skipped
+    """
+    # PnP Device ID for this monitor, uppercased once and reused below
+    pnp = pnp_ids[i] if i < len(pnp_ids) else None
+    pnp_u = pnp.upper() if pnp else None
+
+    # Skip internal laptop displays on Windows
+    # These are identified by specific PnP codes like SHP, BOE, LGD, etc.
+    if IS_WINDOWS and pnp_u:
+        if pnp_u.startswith(INTERNAL_PANEL_PREFIXES):
+            logging.info(f"Skipping internal laptop display at index {i} ({pnp_u})")
+            return None
+
+    if cached is not None:
+        # Name and inputs come from the on-disk monitor cache, so skip the
+        # capabilities and EDID reads and only query the current input below
+        display_name = cached['display_name']
+        input_names = list(cached['inputs'])
+        caps_ok = cacheable = True  # Only successful parses are cached
+    else:
+        display_name, input_names, caps_ok, cacheable = _probe_monitor_identity(i, monitor_obj, pnp, pnp_u)
+
+    # ------------------------------------------------------------------
+    # GET CURRENT INPUT SOURCE
+    # ------------------------------------------------------------------
+    # Skip the DDC/CI round-trip when the capabilities probe failed or
+    # reported no inputs - unresponsive panels stall retrying for seconds
+    current_code = None
+    current_name = "Unknown"
+    if caps_ok and input_names:
+        try:
+            with monitor_obj:
+                current_input = monitor_obj.get_input_source()
+                if hasattr(current_input, 'value'):
+                    # Standard InputSource enum member
+                    current_code = current_input.value
+                    current_name = current_input.name if hasattr(current_input, 'name') else str(current_input)
+                else:
+                    # Raw integer code
+                    current_code = int(current_input)
+                    current_name = get_input_name(current_code)
+        except Exception as e:
+            logging.warning(f"⚠️  Could not read current input: {e}")
+            current_code = None
+            current_name = "Unknown"
+    else:
+        logging.info(f"Skipping current input read for monitor {i} (no DDC/CI inputs)")
+
+    # ------------------------------------------------------------------
+    # RETURN MONITOR DATA
+    # ------------------------------------------------------------------
+    return {
+        "display_name": display_name,          # e.g., "Samsung - C27G2"
+        "inputs": input_names,                  # e.g., ["HDMI1", "DP1", "USB-C"]
+        "id": i,                               # Monitor index for addressing
+        "current_input": current_name          # e.g., "HDMI1"
+    }, cacheable
+
+
+def collect_monitor_data(monitors, cache=None, force=False):
+    """
+    Gather display information for already-enumerated DDC/CI monitors.
+    
+    This function performs DDC/CI communication to detect monitors and
+    retrieve their capabilities including:
+    - Brand name (from PnP ID or model prefix)
+    - Model name (from VCP capabilities or EDID)
+    - Available input sources
+    - Current input source
+    
+    Needs no Tk: the GUI calls it via App.get_all_monitor_data() and
+    the --list CLI calls it directly.
+    
+    Args:
+        monitors: monitorcontrol Monitor objects from get_monitors()
+        cache: Optional monitor cache dict (see App.load_monitor_cache).
+               Only read, never modified, so the caller's copy can be
+               used from another thread. Only used when PnP IDs are
+               available.
+        force: Ignore cached entries and re-read every monitor's
+               capabilities (e.g. for an explicit Refresh)
+    
+    Returns:
+        tuple: (monitors_data, new_cache) where monitors_data is a list of
+               dictionaries containing monitor data:
+            - 'display_name': Human-readable name (e.g., "Samsung - C27G2")
+            - 'inputs': List of available input names (e.g., ["HDMI1", "DP1"])
+            - 'id': Monitor index for addressing
+            - 'current_input': Currently selected input name
+               and new_cache is a new monitor cache dict for the connected
+               monitors, for the caller to keep and save
+    
+    Technical Details:
+        - Uses monitorcontrol library for DDC/CI communication
+        - Uses WMI on Windows to get PnP Device IDs for brand detection
+        - Reads EDID data from registry for model detection fallback
+        - Skips internal laptop displays (identified by specific PnP codes)
+    """
+    pnp_ids = []
+
+    try:
+        logging.info(f"Found {len(monitors)} monitors.")
+
+        # Log display adapter information for debugging
+        if IS_WINDOWS:
+            try:
+                c = _wmi_module().WMI()
+                video_controllers = c.Win32_VideoController()
+                for controller in video_controllers:
+                    logging.info(f"Display adapter: {controller.Name}, Status: {controller.Status}")
+            except Exception as e:
+                logging.warning(f"Could not get display adapter info: {e}")
+
+    except Exception as e:
+        logging.error(f"Could not get monitors: {e}")
+        return [], cache if cache is not None else {}
+
+    # ------------------------------------------------------------------
+    # COLLECT PNP DEVICE IDS FROM WMI (Windows only)
+    # ------------------------------------------------------------------
+    # FIX #1: Collect PnP IDs from WMI once (moved outside the monitor loop)
+    # Previously this was nested inside 'for monitor in monitors:' and used
+    # 'for monitor in wmi_monitors:' which shadowed the outer variable,
+    # causing only 1 monitor to be processed.
+    if IS_WINDOWS:
+        try:
+            c = _wmi_module().WMI()
+            wmi_monitors = c.Win32_DesktopMonitor()
+            for wmi_mon in wmi_monitors:
+                pnp_ids.append(getattr(wmi_mon, 'PNPDeviceID', None))
+        except Exception as e:
+            logging.error(f"Failed to get device information from WMI: {e}")
+        if pnp_ids:
+            # Join on device instance path rather than enumeration order
+            pnp_ids = _align_pnp_ids(monitors, pnp_ids)
+    logging.info(f"WMI PnP IDs: {pnp_ids}")
+
+    # ------------------------------------------------------------------
+    # LOOK UP CACHED MONITOR NAMES AND INPUTS
+    # ------------------------------------------------------------------
+    # Entries are keyed by PnP Device ID and index; none are reused when
+    # the list of connected monitors (PnP IDs) changed or force is set
+    now = time.time()
+    keys = [f"{pnp_ids[i]}#{i}" if i < len(pnp_ids) and pnp_ids[i] else None
+            for i in range(len(monitors))]
+    cached_entries = [None] * len(monitors)
+    if cache and not force and cache.get('pnp_ids') == pnp_ids:
+        entries = cache.get('monitors') or {}
+        for i, key in enumerate(keys):
+            entry = entries.get(key) if key else None
+            if (isinstance(entry, dict) and 'display_name' in entry
+                    and isinstance(entry.get('inputs'), list)
+                    and now - entry.get('ts', 0) < MONITOR_CACHE_TTL):
+                cached_entries[i] = entry
+
+    # ------------------------------------------------------------------
+    # PROCESS EACH DETECTED MONITOR (IN PARALLEL)
+    # ------------------------------------------------------------------
+    # DDC/CI round-trips take hundreds of ms per monitor, but each display
+    # is an independent device, so probe them all concurrently. map()
+    # returns results in monitor order.
+    if monitors:
+        with ThreadPoolExecutor(max_workers=len(monitors), thread_name_prefix="ddc-probe") as executor:
+            results = executor.map(_probe_monitor, range(len(monitors)), monitors,
+                                   [pnp_ids] * len(monitors), cached_entries)
+            results = [result for result in results if result is not None]
+    else:
+        results = []
+    all_data = [data for data, _ in results]
+
+    # Build a new cache for the connected monitors: hits keep their original
+    # timestamp, and only successful capabilities parses are added
+    new_entries = {}
+    for data, cacheable in results:
+        i = data['id']
+        if not keys[i]:
+            continue
+        if cached_entries[i] is not None:
+            new_entries[keys[i]] = cached_entries[i]
+        elif cacheable and data['inputs']:
+            new_entries[keys[i]] = {
+                'display_name': data['display_name'],
+                'inputs': list(data['inputs']),
+                'ts': now
+            }
+    new_cache = {'pnp_ids': list(pnp_ids), 'monitors': new_entries}
+
+    logging.info(f"All monitor data: {all_data}")
+    return all_data, new_cache
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_input(name):
+    """
+    Resolve an input source name to its InputSource enum member.
+    
+    InputSource never changes at runtime, so results are memoized and
+    repeated switches skip the hasattr/getattr attribute walks.
+    
+    Args:
+        name: InputSource attribute name (e.g., "HDMI1", "DP1")
+        
+    Returns:
+        InputSource member, or None if the name is not a valid attribute
+    """
+    return getattr(InputSource, name, None)
+
+
+def _resolve_input_value(name, lenient=False):
+    """
+    Resolve an input source name to a value for set_input_source().
+    
+    Tries the InputSource enum first, then the custom names in
+    INPUT_CODES_BY_NAME (USB-C, THUNDERBOLT), then the "INPUT_<code>" form
+    used for non-standard codes.
+    
+    Args:
+        name: Input source name (e.g., "HDMI1", "USB-C", "INPUT_30")
+        lenient: Also accept case and separator variants such as "hdmi1"
+                 or "usb-c" (used for saved favorites)
+        
+    Returns:
+        InputSource member or int VCP code, or None if not recognized
+    """
+    if lenient:
+        value = _resolve_input(name.replace("-", "_").replace(" ", "_").upper())
+        if value is None:
+            value = INPUT_CODES_BY_NAME.get(name.upper())
+    else:
+        value = _resolve_input(name)
+        if value is None:
+            value = INPUT_CODES_BY_NAME.get(name)
+    if value is None and name.startswith("INPUT_"):
+        try:
+            value = int(name[6:])
+        except ValueError:
+            pass
+    return value
+
+
 def get_input_name(code):
     """
     Convert a DDC/CI input source code to a human-readable name.
@@ -3582,33 +4678,8 @@ def get_input_name(code):
         >>> get_input_name(27)
         'USB-C'
     """
-    # Standard InputSource enum mapping based on DDC/CI specification
-    # VCP_INPUT_THUNDERBOLT (26) and VCP_INPUT_USB_C (27) are custom additions
-    standard_inputs = {
-        0: "NO INPUT",
-        1: "VGA1",         # Changed from ANALOG1/VGA for clarity
-        2: "VGA2",         # Changed from ANALOG2 for clarity
-        3: "DVI1",
-        4: "DVI2",
-        5: "COMPOSITE1",
-        6: "COMPOSITE2",
-        7: "SVIDEO1",
-        8: "SVIDEO2",
-        9: "TUNER1",
-        10: "TUNER2",
-        11: "TUNER3",
-        12: "COMPONENT1",
-        13: "COMPONENT2",
-        14: "COMPONENT3",
-        15: "DP1",         # DisplayPort 1
-        16: "DP2",         # DisplayPort 2
-        17: "HDMI1",
-        18: "HDMI2",
-        VCP_INPUT_THUNDERBOLT: "THUNDERBOLT",  # Code 26
-        VCP_INPUT_USB_C: "USB-C"               # Code 27
-    }
-    
-    return standard_inputs.get(code, f"UNKNOWN CODE {code}")
+    name = INPUT_NAMES_BY_CODE[code] if 0 <= code < len(INPUT_NAMES_BY_CODE) else None
+    return name if name is not None else f"UNKNOWN CODE {code}"
 
 
 def cli_switch_input(monitor_index, input_name):
@@ -3647,15 +4718,16 @@ def cli_switch_input(monitor_index, input_name):
             print(f"Error: Monitor index {monitor_index} is out of range. Found {len(monitors)} monitors.")
             return False
 
-        with monitors[monitor_index] as monitor:
-            # Validate the input name exists in InputSource enum
-            if not hasattr(InputSource, input_name):
-                print(f"Error: Invalid input source: {input_name}")
-                print("Available inputs: " + ", ".join([x for x in dir(InputSource) if not x.startswith('_')]))
-                return False
+        # Validate the input name exists in InputSource enum
+        # (before opening the monitor, so a typo costs no DDC/CI handshake)
+        if input_name not in VALID_INPUT_NAMES:
+            print(f"Error: Invalid input source: {input_name}")
+            print("Available inputs: " + VALID_INPUT_NAMES_TEXT)
+            return False
 
+        with monitors[monitor_index] as monitor:
             # Get the enum value and send DDC/CI command
-            new_input = getattr(InputSource, input_name)
+            new_input = _resolve_input(input_name)
             monitor.set_input_source(new_input)
             print(f"Successfully switched monitor {monitor_index} to {input_name}")
             return True
@@ -3670,8 +4742,8 @@ def cli_list_monitors():
     List all available monitors and their inputs via command line.
     
     This function is used when the application is run with the --list
-    argument. It creates a temporary App instance to detect monitors
-    and prints their information to stdout.
+    argument. It detects monitors with collect_monitor_data() and
+    prints their information to stdout.
     
     Output format:
         Available Monitors:
@@ -3682,14 +4754,12 @@ def cli_list_monitors():
         --------------------------------------------------
         
     Note:
-        Creates and immediately destroys an App instance to use
-        the monitor detection logic, then prints results.
+        No App instance (and so no Tk window) is created, which keeps
+        --list fast.
     """
     try:
-        # Create temporary App instance for monitor detection
-        app = App()
-        monitors_data = app.get_all_monitor_data()
-        app.destroy()  # Clean up the window
+        # Detect monitors directly - no Tk window needed
+        monitors_data, _ = collect_monitor_data(get_monitors())
 
         if not monitors_data:
             print("No monitors found")
@@ -3737,8 +4807,6 @@ if __name__ == "__main__":
     The application logs critical errors to the log file for debugging.
     """
     try:
-        import argparse
-        
         # Set up command line argument parser
         parser = argparse.ArgumentParser(description='Monitor Input Switcher')
         
@@ -3750,22 +4818,20 @@ if __name__ == "__main__":
         
         args = parser.parse_args()
 
-        # Check if any CLI arguments were provided
-        if args.cli or args.list or args.monitor is not None or args.input is not None:
-            # CLI mode - run without GUI
-            if args.list:
-                # List all monitors and exit
-                cli_list_monitors()
-            elif args.monitor is not None and args.input is not None:
-                # Switch specific monitor to specific input
-                cli_switch_input(args.monitor, args.input)
-            else:
-                # Invalid combination of arguments
-                print("Error: For CLI mode, use either --list to list monitors,")
-                print("or both --monitor and --input to switch inputs.")
-                print("\nExample usage:")
-                print("  monitor_manager.exe --list")
-                print("  monitor_manager.exe --monitor 0 --input HDMI1")
+        # Dispatch on the parsed arguments (CLI modes run without GUI)
+        if args.list:
+            # List all monitors and exit
+            cli_list_monitors()
+        elif args.monitor is not None and args.input is not None:
+            # Switch specific monitor to specific input
+            cli_switch_input(args.monitor, args.input)
+        elif args.cli or args.monitor is not None or args.input is not None:
+            # Invalid combination of arguments
+            print("Error: For CLI mode, use either --list to list monitors,")
+            print("or both --monitor and --input to switch inputs.")
+            print("\nExample usage:")
+            print("  monitor_manager.exe --list")
+            print("  monitor_manager.exe --monitor 0 --input HDMI1")
         else:
             # GUI mode - launch the application window
             app = App()
@@ -0,0 +1,73 @@
+"""
+Tests for matching WMI PnP Device IDs to monitorcontrol monitors.
+
+Run from the repository root with the requirements installed:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import monitor_manager_adv as mma  # noqa: E402
+
+GSM = "DISPLAY\\GSM5B10\\5&ABC&0&UID1"
+DEL = "DISPLAY\\DELA1B2\\5&ABC&0&UID2"
+SAM = "DISPLAY\\SAM0F00\\5&ABC&0&UID3"
+
+
+def align(instance_ids, pnp_ids):
+    """Run _align_pnp_ids with monitor i reporting instance_ids[i]."""
+    monitors = list(range(len(instance_ids)))
+    with mock.patch.object(mma, "_monitor_instance_id", side_effect=lambda m: instance_ids[m]):
+        return mma._align_pnp_ids(monitors, pnp_ids)
+
+
+class NormalizeInstanceIdTests(unittest.TestCase):
+
+    def test_wmi_form_is_uppercased(self):
+        self.assertEqual(mma._normalize_instance_id("display\\gsm5b10\\5&abc&0&uid1"), GSM)
+
+    def test_device_interface_form(self):
+        path = "\\\\?\\DISPLAY#GSM5B10#5&abc&0&UID1#{e6f07b5f-ee97-4a90-b076-33f57bf4eaa7}"
+        self.assertEqual(mma._normalize_instance_id(path), GSM)
+
+    def test_empty(self):
+        self.assertIsNone(mma._normalize_instance_id(None))
+        self.assertIsNone(mma._normalize_instance_id(""))
+
+
+class AlignPnpIdsTests(unittest.TestCase):
+
+    def test_exact_matches_reorder_ids(self):
+        self.assertEqual(align([DEL, GSM], [GSM, DEL]), [DEL, GSM])
+
+    def test_positional_fallback_without_instance_ids(self):
+        self.assertEqual(align([None, None], [GSM, DEL]), [GSM, DEL])
+
+    def test_exact_match_wins_over_earlier_positional_fallback(self):
+        # Monitor 0 has no instance path; its positional ID belongs to monitor 1
+        self.assertEqual(align([None, GSM], [GSM, DEL]), [DEL, GSM])
+
+    def test_duplicate_instance_ids_get_distinct_pnp_ids(self):
+        # Two handles resolving to the same path (e.g. a mirrored output)
+        result = align([GSM, GSM, None], [GSM, DEL, SAM])
+        self.assertEqual(result[0], GSM)
+        self.assertEqual(sorted(result), sorted([GSM, DEL, SAM]))
+
+    def test_unmatched_path_falls_back_to_unused_ids(self):
+        self.assertEqual(align(["DISPLAY\\XXX0000\\1", SAM], [SAM, GSM]), [GSM, SAM])
+
+    def test_more_monitors_than_ids(self):
+        self.assertEqual(align([None, None, None], [GSM, DEL]), [GSM, DEL, None])
+
+    def test_positional_id_preferred_over_leftovers(self):
+        # Monitor 0 has no WMI entry; monitor 1 keeps its own positional ID
+        self.assertEqual(align([None, None], [None, DEL]), [None, DEL])
+
+
+if __name__ == "__main__":
+    unittest.main()